@@ -1,3 +1,5 @@
+import importlib
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -6,24 +8,19 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 print(f"Python path: {sys.path}")
 
-try:
-    print("Attempting to import src.climada.hazards...")
-    import src.climada.hazards
-    print("Successfully imported src.climada.hazards")
-    print(f"src.climada.hazards file: {src.climada.hazards.__file__}")
-except ImportError as e:
-    print(f"Failed to import src.climada.hazards: {e}")
+# Locate the module without executing it (no NumPy/CLIMADA import cost)
+print("Looking up src.climada.hazards...")
+spec = importlib.util.find_spec("src.climada.hazards")
+print(f"src.climada.hazards file: {spec.origin if spec else 'MISSING'}")
 
-try:
-    print("Attempting to import load_climada_hazards from src.climada.hazards...")
-    from src.climada.hazards import load_climada_hazards
-    print("Successfully imported load_climada_hazards")
-except ImportError as e:
-    print(f"Failed to import load_climada_hazards: {e}")
-
-try:
-    print("Attempting to import get_hazard_description from src.climada.hazards...")
-    from src.climada.hazards import get_hazard_description
-    print("Successfully imported get_hazard_description")
-except ImportError as e:
-    print(f"Failed to import get_hazard_description: {e}")
+# Pass --deep to actually import the module (once) and check its exports
+if spec and "--deep" in sys.argv:
+    try:
+        mod = importlib.import_module("src.climada.hazards")
+    except ImportError as e:
+        print(f"Failed to import src.climada.hazards: {e}")
+    else:
+        print("Successfully imported src.climada.hazards")
+        for name in ("load_climada_hazards", "get_hazard_description"):
+            status = "found" if hasattr(mod, name) else "MISSING"
+            print(f"{name}: {status}")
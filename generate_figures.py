@@ -1,12 +1,11 @@
 """
 Generate publication-quality figures for the Climate Risk Premium paper.
 """
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
-import numpy as np
 from pathlib import Path
 
+# matplotlib is imported inside each create_* function so that importing this
+# module (test collection, tooling) does not pay the pyplot import cost.
+
 # Set up output directory
 OUTPUT_DIR = Path("data/processed/figures")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -22,32 +21,116 @@ COLORS = {
     'text': '#2c3e50',          # Dark gray - Text
 }
 
+# Cheaper Agg path rendering; the bundled font avoids findfont scans
+RC_PARAMS = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+    'font.family': 'DejaVu Sans',
+}
+
 
-def create_model_architecture_diagram():
-    """Create the model logic flow diagram (Figure 4)."""
-    fig, ax = plt.subplots(figsize=(14, 10))
-    ax.set_xlim(0, 14)
-    ax.set_ylim(0, 10)
+def _pyplot():
+    """Import pyplot on the non-interactive Agg backend with RC_PARAMS applied."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    plt.rcParams.update(RC_PARAMS)
+    return plt
+
+
+def _new_canvas(figsize, xlim, ylim, ax=None):
+    """
+    Create a blank diagram figure with hidden axes spanning the given limits.
+    When ax is given (combined figure) it is reused, with its box shaped like figsize.
+    """
+    if ax is None:
+        plt = _pyplot()
+        fig, ax = plt.subplots(figsize=figsize)
+    else:
+        fig = ax.figure
+        ax.set_box_aspect(figsize[1] / figsize[0])
+        ax.apply_aspect()
+    ax.set_xlim(*xlim)
+    ax.set_ylim(*ylim)
     ax.axis('off')
+    return fig, ax
+
+
+def _save_both(fig, stem, pdf_only=False):
+    """Export a figure as PDF and (unless pdf_only) a 150 dpi optimized PNG, then close it."""
+    plt = _pyplot()
+
+    fig.tight_layout()
+    exports = [('pdf', {})]
+    if not pdf_only:
+        exports.append(('png', {'dpi': 150, 'pil_kwargs': {'optimize': True, 'compress_level': 6}}))
+    for suffix, kwargs in exports:
+        path = OUTPUT_DIR / f'{stem}.{suffix}'
+        fig.savefig(path, bbox_inches='tight', facecolor='white', edgecolor='none', **kwargs)
+        print(f"Saved: {path}")
+    plt.close(fig)
+
+
+def _add_arrows(ax, arrow_specs):
+    """
+    Draw (start, end, arrowprops) specs as one PatchCollection.
+    Each arrow is laid out by FancyArrowPatch (connection style, arrowhead)
+    and frozen to a data-space path, so no per-arrow Annotation artists are
+    registered. Arrowstyles must be unfilled ('->', '<->').
+    """
+    from matplotlib.collections import PatchCollection
+    from matplotlib.patches import FancyArrowPatch, PathPatch
+
+    paths, colors, widths, styles = [], [], [], []
+    for start, end, props in arrow_specs:
+        props = dict(props)
+        colors.append(props.pop('color'))
+        widths.append(props.pop('lw'))
+        styles.append(props.pop('ls', '-'))
+        arrow = FancyArrowPatch(start, end, transform=ax.transData, shrinkA=2, shrinkB=2,
+                                mutation_scale=10, lw=widths[-1], **props)
+        paths.append(PathPatch(arrow.get_path()))
+    ax.add_collection(PatchCollection(paths, facecolors='none', edgecolors=colors,
+                                      linewidths=widths, linestyles=styles))
+
+
+def create_model_architecture_diagram(pdf_only=False, ax=None):
+    """Create the model logic flow diagram (Figure 4)."""
+    plt = _pyplot()
+    from matplotlib.collections import PatchCollection
+    from matplotlib.patches import FancyBboxPatch
+
+    # Bind palette entries to locals once per figure
+    PHYS, TRANS, FIN, OUT, NEU, TEXT = (
+        COLORS['physical'], COLORS['transition'], COLORS['financial'], COLORS['output'],
+        COLORS['neutral'], COLORS['text']
+    )
+
+    standalone = ax is None
+    fig, ax = _new_canvas(figsize=(14, 10), xlim=(0, 14), ylim=(0, 10), ax=ax)
 
     # Title
     ax.text(7, 9.7, 'Climate Risk Premium Model Architecture',
             fontsize=16, fontweight='bold', ha='center', va='top')
 
-    # Helper function for boxes
+    # Helper function for boxes; patches are collected and drawn as one collection
+    boxes, box_colors = [], []
+
     def add_box(x, y, width, height, text, color, fontsize=9, text_color='white'):
-        box = FancyBboxPatch((x - width/2, y - height/2), width, height,
-                             boxstyle="round,pad=0.05,rounding_size=0.2",
-                             facecolor=color, edgecolor='none', alpha=0.9)
-        ax.add_patch(box)
+        boxes.append(FancyBboxPatch((x - width/2, y - height/2), width, height,
+                                    boxstyle="round,pad=0.05,rounding_size=0.2"))
+        box_colors.append(color)
         ax.text(x, y, text, ha='center', va='center', fontsize=fontsize,
                 fontweight='bold', color=text_color, wrap=True)
         return (x, y)
 
-    # Helper function for arrows
+    # Helper function for arrows; drawn together by _add_arrows at the end
+    arrow_specs = []
+
     def add_arrow(start, end, color='#7f8c8d', style='->', label=''):
-        ax.annotate('', xy=end, xytext=start,
-                   arrowprops=dict(arrowstyle=style, color=color, lw=2))
+        arrow_specs.append((start, end, dict(arrowstyle=style, color=color, lw=2)))
         if label:
             mid = ((start[0] + end[0])/2, (start[1] + end[1])/2)
             ax.text(mid[0], mid[1] + 0.2, label, fontsize=7, ha='center', color=color)
@@ -62,46 +145,48 @@ def create_model_architecture_diagram():
     ]
 
     for x, y, w, h, label, color in sections:
-        rect = FancyBboxPatch((x - w/2, y - h/2), w, h,
-                              boxstyle="round,pad=0.1,rounding_size=0.3",
-                              facecolor=color, edgecolor='#bdc3c7', alpha=0.5, lw=1)
-        ax.add_patch(rect)
         ax.text(x, y + h/2 - 0.2, label, fontsize=10, fontweight='bold',
-                ha='center', va='top', color=COLORS['text'])
+                ha='center', va='top', color=TEXT)
+    ax.add_collection(PatchCollection(
+        [FancyBboxPatch((x - w/2, y - h/2), w, h, boxstyle="round,pad=0.1,rounding_size=0.3")
+         for x, y, w, h, _, _ in sections],
+        facecolors=[color for *_, color in sections], edgecolors='#bdc3c7', alpha=0.5, lw=1))
 
     # External Risk Inputs
-    phys_pos = add_box(0.5, 8.5, 2.2, 0.9, 'Physical Hazards\n(CLIMADA)', COLORS['physical'])
-    trans_pos = add_box(3.5, 8.5, 2.2, 0.9, 'Transition Policy\n(Korea Power Plan)', COLORS['transition'])
+    phys_pos = add_box(0.5, 8.5, 2.2, 0.9, 'Physical Hazards\n(CLIMADA)', PHYS)
+    trans_pos = add_box(3.5, 8.5, 2.2, 0.9, 'Transition Policy\n(Korea Power Plan)', TRANS)
 
     # Data Sources
     data_sources = add_box(9, 8.5, 3.2, 1.2,
                            'Plant Parameters\nKIS Rating Grid\nDebt Schedule',
-                           COLORS['neutral'], fontsize=8)
+                           NEU, fontsize=8)
 
     # Operational Impact Layer
-    gen_pos = add_box(1, 6, 2.2, 1, 'Generation\nVolume (MWh)', COLORS['physical'], fontsize=8)
-    carbon_pos = add_box(3.5, 6, 2, 0.8, 'Carbon\nCosts', COLORS['transition'], fontsize=8)
+    gen_pos = add_box(1, 6, 2.2, 1, 'Generation\nVolume (MWh)', PHYS, fontsize=8)
+    carbon_pos = add_box(3.5, 6, 2, 0.8, 'Carbon\nCosts', TRANS, fontsize=8)
 
     # Physical risk details
     ax.text(0.5, 7.4, 'Wildfire Outage\nFlood Risk\nSLR Derating', fontsize=7,
-            ha='center', va='center', style='italic', color=COLORS['physical'])
+            ha='center', va='center', style='italic', color=PHYS)
 
     # Transition risk details
     ax.text(3.5, 7.4, 'Dispatch Caps\nCarbon Price\nPhase-out', fontsize=7,
-            ha='center', va='center', style='italic', color=COLORS['transition'])
+            ha='center', va='center', style='italic', color=TRANS)
 
     # Financial Model
-    rev_pos = add_box(7.5, 6.5, 1.8, 0.7, 'Revenue', COLORS['financial'], fontsize=8)
-    ebitda_pos = add_box(9, 5.5, 1.8, 0.7, 'EBITDA', COLORS['financial'], fontsize=8)
-    cfads_pos = add_box(10.5, 6.5, 1.8, 0.7, 'CFADS', COLORS['financial'], fontsize=8)
+    rev_pos = add_box(7.5, 6.5, 1.8, 0.7, 'Revenue', FIN, fontsize=8)
+    ebitda_pos = add_box(9, 5.5, 1.8, 0.7, 'EBITDA', FIN, fontsize=8)
+    cfads_pos = add_box(10.5, 6.5, 1.8, 0.7, 'CFADS', FIN, fontsize=8)
 
     # Credit Rating & Valuation
-    dscr_pos = add_box(4, 2.5, 2, 0.9, 'DSCR / LLCR\n(Coverage Ratios)', COLORS['financial'], fontsize=8)
+    dscr_pos = add_box(4, 2.5, 2, 0.9, 'DSCR / LLCR\n(Coverage Ratios)', FIN, fontsize=8)
     rating_pos = add_box(7, 2.5, 2.2, 0.9, 'Credit Rating\n(AAA → B)', '#9b59b6')
     cod_pos = add_box(10, 2.5, 2, 0.9, 'Cost of Debt\n(Spread)', '#9b59b6', fontsize=8)
 
     # Final output
-    npv_pos = add_box(7, 0.8, 2.5, 1, 'NPV\n(Project Value)', COLORS['output'])
+    npv_pos = add_box(7, 0.8, 2.5, 1, 'NPV\n(Project Value)', OUT)
+
+    ax.add_collection(PatchCollection(boxes, facecolors=box_colors, edgecolors='none', alpha=0.9))
 
     # Draw arrows
     # Physical → Generation
@@ -125,9 +210,9 @@ def create_model_architecture_diagram():
 
     # CFADS → DSCR
     add_arrow((10.5, 6.1), (10.5, 4.5), color='#7f8c8d')
-    ax.annotate('', xy=(5, 2.9), xytext=(10.5, 4.5),
-               arrowprops=dict(arrowstyle='->', color='#7f8c8d', lw=2,
-                              connectionstyle='arc3,rad=0.3'))
+    arrow_specs.append(((10.5, 4.5), (5, 2.9),
+                        dict(arrowstyle='->', color='#7f8c8d', lw=2,
+                             connectionstyle='arc3,rad=0.3')))
 
     # DSCR → Rating
     add_arrow((5, 2.5), (5.9, 2.5), label='KIS Method')
@@ -136,29 +221,31 @@ def create_model_architecture_diagram():
     add_arrow((8.1, 2.5), (9, 2.5), label='Spread Matrix')
 
     # Cost of Debt → NPV (via WACC)
-    ax.annotate('', xy=(8.25, 1.3), xytext=(10, 2),
-               arrowprops=dict(arrowstyle='->', color='#9b59b6', lw=2,
-                              connectionstyle='arc3,rad=-0.3'))
+    arrow_specs.append(((10, 2), (8.25, 1.3),
+                        dict(arrowstyle='->', color='#9b59b6', lw=2,
+                             connectionstyle='arc3,rad=-0.3')))
     ax.text(9.5, 1.5, 'WACC', fontsize=7, ha='center', color='#9b59b6')
 
     # CFADS → NPV (cash flows)
-    ax.annotate('', xy=(7.5, 1.3), xytext=(10.5, 5.5),
-               arrowprops=dict(arrowstyle='->', color=COLORS['financial'], lw=2,
-                              connectionstyle='arc3,rad=0.4'))
-    ax.text(10, 3.5, 'Cash Flows', fontsize=7, ha='center', color=COLORS['financial'])
+    arrow_specs.append(((10.5, 5.5), (7.5, 1.3),
+                        dict(arrowstyle='->', color=FIN, lw=2,
+                             connectionstyle='arc3,rad=0.4')))
+    ax.text(10, 3.5, 'Cash Flows', fontsize=7, ha='center', color=FIN)
 
     # Add feedback loop indicator
-    ax.annotate('', xy=(9, 3), xytext=(9, 4),
-               arrowprops=dict(arrowstyle='<->', color='#c0392b', lw=1.5, ls='--'))
+    arrow_specs.append(((9, 4), (9, 3),
+                        dict(arrowstyle='<->', color='#c0392b', lw=1.5, ls='--')))
     ax.text(8.2, 3.5, 'Death\nSpiral', fontsize=7, ha='center', color='#c0392b', fontweight='bold')
 
+    _add_arrows(ax, arrow_specs)
+
     # Legend
     legend_items = [
-        (COLORS['physical'], 'Physical Risk'),
-        (COLORS['transition'], 'Transition Risk'),
-        (COLORS['financial'], 'Financial Metrics'),
+        (PHYS, 'Physical Risk'),
+        (TRANS, 'Transition Risk'),
+        (FIN, 'Financial Metrics'),
         ('#9b59b6', 'Credit/Cost of Capital'),
-        (COLORS['output'], 'Output (NPV)'),
+        (OUT, 'Output (NPV)'),
     ]
 
     for i, (color, label) in enumerate(legend_items):
@@ -166,21 +253,24 @@ def create_model_architecture_diagram():
                                    facecolor=color, edgecolor='none'))
         ax.text(12, 0.42 + i*0.35, label, fontsize=8, va='center')
 
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'fig4_model_architecture.png', dpi=300, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.savefig(OUTPUT_DIR / 'fig4_model_architecture.pdf', bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
-    print(f"Saved: {OUTPUT_DIR / 'fig4_model_architecture.png'}")
+    if standalone:
+        _save_both(fig, 'fig4_model_architecture', pdf_only)
+    return ax
 
 
-def create_credit_death_spiral_diagram():
+def create_credit_death_spiral_diagram(pdf_only=False, ax=None):
     """Create the credit rating death spiral feedback loop diagram (Figure 5)."""
-    fig, ax = plt.subplots(figsize=(10, 8))
-    ax.set_xlim(0, 10)
-    ax.set_ylim(0, 10)
-    ax.axis('off')
+    import numpy as np
+    from matplotlib.collections import LineCollection, PatchCollection
+    from matplotlib.patches import Circle
+
+    # Bind palette entries to locals once per figure
+    PHYS, TRANS, FIN, OUT = (
+        COLORS['physical'], COLORS['transition'], COLORS['financial'], COLORS['output']
+    )
+
+    standalone = ax is None
+    fig, ax = _new_canvas(figsize=(10, 8), xlim=(0, 10), ylim=(0, 10), ax=ax)
 
     # Title
     ax.text(5, 9.5, 'The Credit Rating Death Spiral',
@@ -192,52 +282,43 @@ def create_credit_death_spiral_diagram():
     center_x, center_y = 5, 5
     radius = 2.5
 
-    # Four main nodes
-    positions = {
-        'climate': (center_x, center_y + radius),      # Top
-        'cashflow': (center_x + radius, center_y),     # Right
-        'rating': (center_x, center_y - radius),       # Bottom
-        'cost': (center_x - radius, center_y),         # Left
-    }
-
-    # Node styling
-    def add_node(pos, text, subtext, color):
-        circle = plt.Circle(pos, 0.8, facecolor=color, edgecolor='white',
-                           linewidth=3, alpha=0.9)
-        ax.add_patch(circle)
-        ax.text(pos[0], pos[1] + 0.1, text, ha='center', va='center',
+    # Four main nodes, clockwise from the top: climate, cash flow, rating, cost
+    pos = np.array([[center_x, center_y + radius],
+                    [center_x + radius, center_y],
+                    [center_x, center_y - radius],
+                    [center_x - radius, center_y]])
+
+    # Nodes as one PatchCollection of 0.8-unit circles in data space, so they keep
+    # matching the arrow endpoints whatever the final axes size
+    node_colors = [PHYS, FIN, '#9b59b6', TRANS]
+    ax.add_collection(PatchCollection([Circle(xy, 0.8) for xy in pos], facecolors=node_colors,
+                                      edgecolors='white', linewidths=3, alpha=0.9))
+
+    labels = [('Climate', 'Risks'), ('Cash', 'Flow ↓'), ('Credit', 'Rating ↓'), ('Cost of', 'Debt ↑')]
+    for (x, y), (text, subtext) in zip(pos, labels):
+        ax.text(x, y + 0.1, text, ha='center', va='center',
                fontsize=10, fontweight='bold', color='white')
-        ax.text(pos[0], pos[1] - 0.25, subtext, ha='center', va='center',
+        ax.text(x, y - 0.25, subtext, ha='center', va='center',
                fontsize=7, color='white')
 
-    add_node(positions['climate'], 'Climate', 'Risks', COLORS['physical'])
-    add_node(positions['cashflow'], 'Cash', 'Flow ↓', COLORS['financial'])
-    add_node(positions['rating'], 'Credit', 'Rating ↓', '#9b59b6')
-    add_node(positions['cost'], 'Cost of', 'Debt ↑', COLORS['transition'])
-
-    # Curved arrows connecting nodes
+    # Curved arrows connecting each node to the next, inset from both node centres
     arrow_style = dict(arrowstyle='->', color='#2c3e50', lw=2.5,
                       connectionstyle='arc3,rad=0.3')
+    starts, ends = pos[:3], np.roll(pos, -1, axis=0)[:3]
+    unit = (ends - starts) / np.linalg.norm(ends - starts, axis=1, keepdims=True)
+    inset = np.sqrt(0.5) * unit
+    arrow_specs = [(tuple(a), tuple(b), arrow_style) for a, b in zip(starts + inset, ends - inset)]
 
-    # Climate → Cash Flow
-    ax.annotate('', xy=(7, 5.5), xytext=(5.5, 7),
-               arrowprops=arrow_style)
+    # Climate → Cash Flow, Cash Flow → Rating, Rating → Cost
     ax.text(6.7, 6.5, 'Reduces\nRevenue', fontsize=8, ha='center', color='#7f8c8d')
-
-    # Cash Flow → Rating
-    ax.annotate('', xy=(5.5, 3), xytext=(7, 4.5),
-               arrowprops=arrow_style)
     ax.text(6.7, 3.5, 'DSCR\nFalls', fontsize=8, ha='center', color='#7f8c8d')
-
-    # Rating → Cost
-    ax.annotate('', xy=(3, 4.5), xytext=(4.5, 3),
-               arrowprops=arrow_style)
     ax.text(3.3, 3.5, 'Spread\nWidens', fontsize=8, ha='center', color='#7f8c8d')
 
     # Cost → Cash Flow (feedback!)
-    ax.annotate('', xy=(6.8, 5), xytext=(3.3, 5),
-               arrowprops=dict(arrowstyle='->', color='#c0392b', lw=3,
-                              connectionstyle='arc3,rad=-0.4', linestyle='--'))
+    arrow_specs.append(((3.3, 5), (6.8, 5),
+                        dict(arrowstyle='->', color='#c0392b', lw=3,
+                             connectionstyle='arc3,rad=-0.4', ls='--')))
+    _add_arrows(ax, arrow_specs)
     ax.text(5, 3.8, 'Higher Interest\nExpense', fontsize=8, ha='center',
            color='#c0392b', fontweight='bold')
 
@@ -250,16 +331,20 @@ def create_credit_death_spiral_diagram():
     ax.text(0.5, 8.5, 'Example Death Spiral Pathway:', fontsize=11, fontweight='bold')
 
     steps = [
-        ('T=0', 'A Rating, 6.1% yield', COLORS['output']),
-        ('T=5', 'DSCR < 2.0 → BBB (250 bps)', COLORS['financial']),
-        ('T=6', 'Higher interest → DSCR < 1.5 → BB (400 bps)', COLORS['physical']),
-        ('T=7', 'EBITDA negative → B (600 bps)', COLORS['transition']),
+        ('T=0', 'A Rating, 6.1% yield', OUT),
+        ('T=5', 'DSCR < 2.0 → BBB (250 bps)', FIN),
+        ('T=6', 'Higher interest → DSCR < 1.5 → BB (400 bps)', PHYS),
+        ('T=7', 'EBITDA negative → B (600 bps)', TRANS),
         ('T=8', 'Refinancing impossible → Technical Default', '#c0392b'),
     ]
 
-    for i, (time, desc, color) in enumerate(steps):
-        y_pos = 8 - i * 0.5
-        ax.plot([0.5, 0.8], [y_pos, y_pos], color=color, lw=3)
+    # Colored step markers as one LineCollection of (0.5, y) → (0.8, y) segments
+    ys = 8 - np.arange(len(steps)) * 0.5
+    segs = np.stack([np.column_stack([np.full_like(ys, 0.5), ys]),
+                     np.column_stack([np.full_like(ys, 0.8), ys])], axis=1)
+    ax.add_collection(LineCollection(segs, colors=[c for _, _, c in steps], linewidth=3,
+                                  capstyle='projecting'))
+    for y_pos, (time, desc, _) in zip(ys, steps):
         ax.text(0.9, y_pos, f'{time}:', fontsize=9, fontweight='bold', va='center')
         ax.text(1.6, y_pos, desc, fontsize=9, va='center')
 
@@ -275,21 +360,23 @@ def create_credit_death_spiral_diagram():
     ax.text(5, 0.6, insight_text, ha='center', va='center', fontsize=9,
            bbox=dict(boxstyle='round', facecolor='#fdf2e9', edgecolor='#e67e22', alpha=0.9))
 
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'fig5_death_spiral.png', dpi=300, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.savefig(OUTPUT_DIR / 'fig5_death_spiral.pdf', bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
-    print(f"Saved: {OUTPUT_DIR / 'fig5_death_spiral.png'}")
+    if standalone:
+        _save_both(fig, 'fig5_death_spiral', pdf_only)
+    return ax
 
 
-def create_data_flow_diagram():
+def create_data_flow_diagram(pdf_only=False, ax=None):
     """Create the data sources and integration diagram (Figure 6)."""
-    fig, ax = plt.subplots(figsize=(12, 8))
-    ax.set_xlim(0, 12)
-    ax.set_ylim(0, 8)
-    ax.axis('off')
+    from matplotlib.patches import FancyBboxPatch
+
+    # Bind palette entries to locals once per figure
+    PHYS, TRANS, FIN, OUT, TEXT = (
+        COLORS['physical'], COLORS['transition'], COLORS['financial'], COLORS['output'],
+        COLORS['text']
+    )
+
+    standalone = ax is None
+    fig, ax = _new_canvas(figsize=(12, 8), xlim=(0, 12), ylim=(0, 8), ax=ax)
 
     # Title
     ax.text(6, 7.7, 'Data Integration Framework',
@@ -297,9 +384,9 @@ def create_data_flow_diagram():
 
     # Three data sources at top
     sources = [
-        (2, 6.5, 'Korea Power\nSupply Plan\n(MOTIE)', COLORS['transition'],
+        (2, 6.5, 'Korea Power\nSupply Plan\n(MOTIE)', TRANS,
          '• 10th/11th Basic Plan\n• Coal dispatch trajectory\n• Capacity factors 2024-2050'),
-        (6, 6.5, 'CLIMADA\nHazard Data\n(ETH Zurich)', COLORS['physical'],
+        (6, 6.5, 'CLIMADA\nHazard Data\n(ETH Zurich)', PHYS,
          '• Wildfire (FWI Index)\n• Flood (GLOFAS)\n• Sea Level Rise (IPCC AR6)'),
         (10, 6.5, 'KIS Credit\nMethodology\n(Korea Investors Service)', '#9b59b6',
          '• Rating thresholds\n• DSCR/LLCR criteria\n• Spread matrix'),
@@ -319,12 +406,12 @@ def create_data_flow_diagram():
                                     boxstyle="round,pad=0.05,rounding_size=0.1",
                                     facecolor='white', edgecolor=color, alpha=0.9, lw=2)
         ax.add_patch(detail_box)
-        ax.text(x, y-1.6, details, ha='center', va='center', fontsize=8, color=COLORS['text'])
+        ax.text(x, y-1.6, details, ha='center', va='center', fontsize=8, color=TEXT)
 
     # Central integration box
     int_box = FancyBboxPatch((3.5, 1.8), 5, 1.4,
                              boxstyle="round,pad=0.05,rounding_size=0.2",
-                             facecolor=COLORS['financial'], edgecolor='none', alpha=0.9)
+                             facecolor=FIN, edgecolor='none', alpha=0.9)
     ax.add_patch(int_box)
     ax.text(6, 2.5, 'CRP Model Integration Layer', ha='center', va='center',
            fontsize=12, fontweight='bold', color='white')
@@ -334,7 +421,7 @@ def create_data_flow_diagram():
     # Output
     out_box = FancyBboxPatch((4, 0.3), 4, 0.9,
                              boxstyle="round,pad=0.05,rounding_size=0.2",
-                             facecolor=COLORS['output'], edgecolor='none', alpha=0.9)
+                             facecolor=OUT, edgecolor='none', alpha=0.9)
     ax.add_patch(out_box)
     ax.text(6, 0.75, 'NPV | IRR | DSCR | Credit Rating | CRP', ha='center', va='center',
            fontsize=10, fontweight='bold', color='white')
@@ -349,19 +436,52 @@ def create_data_flow_diagram():
     ax.annotate('', xy=(6, 1.2), xytext=(6, 1.8),
                arrowprops=dict(arrowstyle='->', color='#7f8c8d', lw=2))
 
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'fig6_data_integration.png', dpi=300, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.savefig(OUTPUT_DIR / 'fig6_data_integration.pdf', bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
-    print(f"Saved: {OUTPUT_DIR / 'fig6_data_integration.png'}")
+    if standalone:
+        _save_both(fig, 'fig6_data_integration', pdf_only)
+    return ax
+
+
+def create_combined_figure(pdf_only=False):
+    """Draw Figures 4-6 as stacked panels of one figure (single canvas and layout pass)."""
+    plt = _pyplot()
+
+    fig = plt.figure(figsize=(14, 26))
+    gs = fig.add_gridspec(3, 1, height_ratios=(10, 8, 8))
+    for i, name in enumerate(_TASKS):
+        globals()[name](pdf_only, ax=fig.add_subplot(gs[i]))
+    _save_both(fig, 'fig_combined', pdf_only)
+
+
+# Creator names, dispatched by name so they pickle into worker processes
+_TASKS = (
+    'create_model_architecture_diagram',
+    'create_credit_death_spiral_diagram',
+    'create_data_flow_diagram',
+)
+
+
+def _run(name, pdf_only=False):
+    """Run one figure creator by name (process-pool entry point)."""
+    globals()[name](pdf_only)
 
 
 if __name__ == '__main__':
+    import argparse
+    from concurrent.futures import ProcessPoolExecutor
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pdf-only', action='store_true',
+                        help='skip the PNG exports and write vector PDFs only')
+    parser.add_argument('--combined', action='store_true',
+                        help='also stack Figures 4-6 into one fig_combined figure')
+    args = parser.parse_args()
+
     print("Generating publication figures...")
-    create_model_architecture_diagram()
-    create_credit_death_spiral_diagram()
-    create_data_flow_diagram()
+    # paper.tex includes the per-figure files, so they are always written
+    # The diagrams share no state, so render them in separate processes
+    with ProcessPoolExecutor(max_workers=len(_TASKS)) as ex:
+        list(ex.map(_run, _TASKS, [args.pdf_only] * len(_TASKS)))
+    if args.combined:
+        create_combined_figure(args.pdf_only)
     print("\nAll figures generated successfully!")
     print(f"Output directory: {OUTPUT_DIR.absolute()}")
@@ -3,10 +3,12 @@
 Quick runner script for Climate Risk Premium analysis.
 """
 from pathlib import Path
-from src.pipeline.runner import CRPModelRunner
 
 
 def main():
+    # Imported here so that importing this script does not load the model stack
+    from src.pipeline.runner import CRPModelRunner
+
     print("=" * 70)
     print("Climate Risk Premium Analysis - Samcheok Power Plant")
     print("=" * 70)
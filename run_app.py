@@ -1,8 +1,8 @@
 import os
 import sys
-from streamlit.web import cli as stcli
 
-if __name__ == "__main__":
+
+def main():
     # Ensure the project root is in sys.path
     project_root = os.path.dirname(os.path.abspath(__file__))
     if project_root not in sys.path:
@@ -17,4 +17,13 @@ if __name__ == "__main__":
     print(f"Launching Streamlit app from: {script_path}")
     print(f"Python path: {sys.path[0]}")
     
+    # Streamlit runs in this process (no second interpreter); its import is
+    # deferred to here. Check startup regressions with:
+    #   PYTHONPROFILEIMPORTTIME=1 python run_app.py 2> import.log && tuna import.log
+    from streamlit.web import cli as stcli
+
     sys.exit(stcli.main())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,23 @@
 
-import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
-import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # headless; set before seaborn pulls in pyplot
+import matplotlib.style
 import numpy as np
 from pathlib import Path
 import seaborn as sns
-from src.pipeline.runner import CRPModelRunner
-from src.risk.credit_rating import calculate_rating_metrics_from_financials, assess_credit_rating
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from src.pipeline.runner import CRPModelRunner, model_source_version
+from src.risk.credit_rating import assess_credit_rating_batch
+
+try:
+    from joblib import Memory
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
 
 # Set professional style
-plt.style.use('seaborn-v0_8-paper')
+matplotlib.style.use('seaborn-v0_8-paper')
 sns.set_context("paper", font_scale=1.4)
 sns.set_style("whitegrid")
 
@@ -24,11 +32,32 @@ COLORS = {
     "Neutral": "#95a5a6"
 }
 
+# One figure, built off pyplot (no figure manager) and printed straight through Agg,
+# is cleared and resized for each paper figure instead of allocating a new one
+_FIG = Figure(figsize=(12, 7), dpi=200, layout="constrained")
+
+def _reset_figure(figsize):
+    """Clear the shared figure, resize it and return it with a fresh single axes."""
+    _FIG.clear()
+    _FIG.set_size_inches(figsize)
+    return _FIG, _FIG.add_subplot()
+
 def setup_runner():
     base_dir = Path(".")
     runner = CRPModelRunner(base_dir)
     return runner
 
+def _raw_data_version(base_dir):
+    """Names and mtimes of the raw input CSVs; part of the cache key."""
+    return tuple(sorted((p.name, p.stat().st_mtime) for p in (Path(base_dir) / "data" / "raw").glob("*.csv")))
+
+def _run(scenarios, data_version, code_version, runner):
+    """Run scenarios given as tuples of (key, value) pairs."""
+    return runner.run_multi_scenario([dict(s) for s in scenarios])
+
+# Persistent cache so figure-only edits don't re-run the model; without joblib every run is fresh
+_cached_run = Memory("data/cache/figures", verbose=0).cache(_run, ignore=["runner"]) if JOBLIB_AVAILABLE else _run
+
 def run_scenarios(runner):
     scenarios = [
         {"name": "Baseline (10th Plan)", "transition": "baseline", "physical": "baseline", "power_plan": "official_10th_plan"},
@@ -36,44 +65,40 @@ def run_scenarios(runner):
         {"name": "11th Plan + High Physical", "transition": "baseline", "physical": "high_physical", "power_plan": "official_11th_plan"},
         {"name": "11th Plan + Extreme Physical", "transition": "baseline", "physical": "extreme_physical", "power_plan": "official_11th_plan"},
     ]
-    return runner.run_multi_scenario(scenarios)
+    # Hashable, order-independent form of each scenario for the cache key
+    scenarios_key = tuple(tuple(sorted(s.items())) for s in scenarios)
+    return _cached_run(scenarios_key, _raw_data_version(runner.base_dir),
+                       model_source_version(exclude=(Path(__file__),)), runner)
 
 def plot_npv_comparison(results, output_dir):
     """Figure 1: NPV Comparison across scenarios."""
-    data = []
-    for name, res in results.items():
-        data.append({"Scenario": name, "NPV ($B)": res.metrics.npv / 1e9})
-    
-    df = pd.DataFrame(data)
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
+    names = list(results)
+    npvs = np.fromiter((res.metrics.npv for res in results.values()), dtype=float, count=len(names)) / 1e9
+
+    fig, ax = _reset_figure((10, 6))
     
     # Color mapping
     colors = [COLORS["Baseline"] if "Baseline" in x else 
               COLORS["Transition"] if "Only" in x else 
-              COLORS["Combined"] for x in df["Scenario"]]
+              COLORS["Combined"] for x in names]
     
-    bars = ax.bar(df["Scenario"], df["NPV ($B)"], color=colors, width=0.6)
+    bars = ax.bar(names, npvs, color=colors, width=0.6, rasterized=True)
     
-    # Add value labels
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + (0.1 if height > 0 else -0.3),
-                f'${height:.1f}B',
-                ha='center', va='bottom' if height > 0 else 'top', fontsize=12, fontweight='bold')
+    # Add value labels (one bar_label pass; negative bars are labelled below)
+    ax.bar_label(bars, labels=[f'${h:.1f}B' for h in npvs],
+                 padding=3, fontsize=12, fontweight='bold')
+    ax.margins(y=0.1)
     
     ax.axhline(0, color='black', linewidth=1)
     ax.set_ylabel("Net Present Value (Billions USD)", fontweight='bold')
     ax.set_title("Figure 1: Impact of Policy and Physical Risks on Project NPV", fontweight='bold', pad=20)
     
     # Formatting
-    plt.xticks(rotation=15, ha='right')
+    ax.set_xticks(range(len(names)), names, rotation=15, ha='right')
     ax.yaxis.grid(True, linestyle='--', alpha=0.7)
     ax.xaxis.grid(False)
     
-    plt.tight_layout()
-    plt.savefig(output_dir / "fig1_npv_comparison.png", dpi=300, bbox_inches='tight')
-    plt.close()
+    FigureCanvasAgg(fig).print_png(output_dir / "fig1_npv_comparison.png")
 
 def plot_waterfall(results, output_dir):
     """Figure 2: Cash Flow Waterfall for Combined Scenario."""
@@ -85,60 +110,48 @@ def plot_waterfall(results, output_dir):
     res = results[target_scenario]
     cf = res.cashflow
     
-    # Aggregate lifetime values
-    revenue = cf.revenue.sum() / 1e9
-    fuel = -cf.fuel_costs.sum() / 1e9
-    opex = -(cf.variable_opex.sum() + cf.fixed_opex.sum()) / 1e9
-    carbon = -cf.carbon_costs.sum() / 1e9
-    outage = -cf.outage_costs.sum() / 1e9 # Physical risk impact
-    ebitda = cf.ebitda.sum() / 1e9
-    depr = -cf.depreciation.sum() / 1e9
-    interest = -cf.interest_expense.sum() / 1e9
-    tax = -cf.tax_expense.sum() / 1e9
-    net_income = cf.net_income.sum() / 1e9
+    # Aggregate lifetime values in one reduction; costs are flipped negative
+    lines = np.stack([cf.revenue, cf.fuel_costs, cf.variable_opex, cf.fixed_opex,
+                      cf.carbon_costs, cf.outage_costs, cf.ebitda, cf.depreciation,
+                      cf.interest_expense, cf.tax_expense, cf.net_income])
+    signs = np.array([1, -1, -1, -1, -1, -1, 1, -1, -1, -1, 1])
+    totals = signs * lines.sum(axis=1) / 1e9
+    (revenue, fuel, variable_opex, fixed_opex, carbon,
+     outage, ebitda, depr, interest, tax, net_income) = totals  # outage = physical risk impact
+    opex = variable_opex + fixed_opex
     
     # Waterfall data
-    steps = ["Revenue", "Fuel Costs", "O&M Costs", "Carbon Costs", "Physical Outage", "EBITDA", 
+    steps = ["Revenue", "Fuel Costs", "O&M Costs", "Carbon Costs", "Physical Outage", "EBITDA",
              "Depreciation", "Interest", "Tax", "Net Income"]
-    values = [revenue, fuel, opex, carbon, outage, 0, depr, interest, tax, 0]
-    
-    # Calculate subtotals
-    # EBITDA is a subtotal, Net Income is a final total
-    # We need to structure it for a waterfall chart
-    # Start -> Changes -> Subtotal -> Changes -> Final
-    
-    # Let's simplify: Revenue -> Costs -> EBITDA -> Financials -> Net Income
-    
-    fig, ax = plt.subplots(figsize=(12, 7))
-    
-    # Cumulative sum for positioning
-    # We need to handle "total" bars differently
-    
-    # Custom waterfall logic
-    running_total = 0
+    values = np.array([revenue, fuel, opex, carbon, outage, 0, depr, interest, tax, 0])
+
+    # EBITDA is a subtotal and Net Income the final total; both are drawn from zero
+    # up to the running level, every other step floats on the level before it.
+    is_total = np.isin(steps, ["EBITDA", "Net Income"])
+    level = np.cumsum(values)  # totals carry 0, so their level is the subtotal
+    # The total bars show the model's own EBITDA and Net Income, which the line items must reach
+    if not np.allclose(level[is_total], [ebitda, net_income]):
+        raise ValueError("Waterfall line items do not sum to the model's EBITDA and Net Income")
+    level[is_total] = ebitda, net_income
+    heights = np.where(is_total, level, values)
+    bottoms = np.where(is_total, 0, level - values)
+
+    colors = np.where(values >= 0, COLORS["Positive"], COLORS["Negative"])
+    colors[is_total] = COLORS["Baseline"]
+    labels = [f"${h:.1f}B" if total else f"{h:+.1f}" for h, total in zip(heights, is_total)]
+
+    fig, ax = _reset_figure((12, 7))
+
     x_pos = np.arange(len(steps))
-    
-    for i, (step, val) in enumerate(zip(steps, values)):
-        if step == "EBITDA":
-            # Subtotal bar
-            total = revenue + fuel + opex + carbon + outage
-            ax.bar(i, total, color=COLORS["Baseline"], label="Subtotal")
-            ax.text(i, total + 0.5, f"${total:.1f}B", ha='center', va='bottom', fontweight='bold')
-            running_total = total
-        elif step == "Net Income":
-            # Final bar
-            total = running_total + depr + interest + tax
-            ax.bar(i, total, color=COLORS["Baseline"], label="Total")
-            ax.text(i, total + 0.5, f"${total:.1f}B", ha='center', va='bottom', fontweight='bold')
-        else:
-            # Change bar
-            color = COLORS["Positive"] if val >= 0 else COLORS["Negative"]
-            ax.bar(i, val, bottom=running_total, color=color)
-            # Label
-            label_y = running_total + val + (0.5 if val > 0 else -1.5)
-            ax.text(i, label_y, f"{val:+.1f}", ha='center', va='bottom' if val > 0 else 'top', fontsize=10)
-            running_total += val
-            
+    bars = ax.bar(x_pos, heights, bottom=bottoms, color=colors, rasterized=True)
+    texts = ax.bar_label(bars, labels=labels, padding=3, fontsize=10)
+    for i in np.flatnonzero(is_total):
+        texts[i].set(fontweight='bold', fontsize=matplotlib.rcParams["font.size"])
+    # bar_label text does not expand the data limits; floating bars would otherwise
+    # pin the limits to their (sticky) bottoms
+    ax.use_sticky_edges = False
+    ax.margins(y=0.08)
+
     ax.set_xticks(x_pos)
     ax.set_xticklabels(steps, rotation=30, ha='right')
     ax.set_ylabel("Lifetime Value (Billions USD)", fontweight='bold')
@@ -147,66 +160,51 @@ def plot_waterfall(results, output_dir):
     ax.axhline(0, color='black', linewidth=0.8)
     ax.yaxis.grid(True, linestyle='--', alpha=0.5)
     
-    plt.tight_layout()
-    plt.savefig(output_dir / "fig2_waterfall.png", dpi=300, bbox_inches='tight')
-    plt.close()
+    FigureCanvasAgg(fig).print_png(output_dir / "fig2_waterfall.png")
 
 def plot_rating_migration(results, output_dir):
     """Figure 3: Credit Rating Migration."""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = _reset_figure((10, 6))
     
     rating_map = {"AAA": 1, "AA": 2, "A": 3, "BBB": 4, "BB": 5, "B": 6, "CCC": 7}
     reverse_map = {v: k for k, v in rating_map.items()}
     
+    # Plant params (simplified retrieval)
+    # In a real script we'd pass these properly, but here we estimate
+    capacity_mw = 2100
+    total_capex = 4.9e9 # $4.9B
+    debt_fraction = 0.7
+    equity_fraction = 0.3
+
+    total_debt = total_capex * debt_fraction
+    total_equity = total_capex * equity_fraction
+
     for name, res in results.items():
         cf = res.cashflow
         years = cf.years
-        
+
         # Filter years to 2024-2040
         mask = (years >= 2024) & (years <= 2040)
         years_plot = years[mask]
-        
-        ratings_vals = []
-        
-        # Plant params (simplified retrieval)
-        # In a real script we'd pass these properly, but here we estimate
-        capacity_mw = 2100
-        total_capex = 4.9e9 # $4.9B
-        debt_fraction = 0.7
-        equity_fraction = 0.3
-        debt_interest = 0.06 # 6%
-        
-        total_debt = total_capex * debt_fraction
-        total_equity = total_capex * equity_fraction
-        
-        # Calculate rating for each year
-        for i, year in enumerate(years):
-            if not mask[i]: continue
-            
-            ebitda = cf.ebitda[i]
-            interest = cf.interest_expense[i]
-            
-            # Amortize debt
-            # Simplified: assume linear paydown for leverage ratio calculation
-            # (This is an approximation for the plot)
-            current_debt = total_debt * (1 - (i / 30)) 
-            if current_debt < 0: current_debt = 0
-            
-            # Metrics
-            metrics = calculate_rating_metrics_from_financials(
-                capacity_mw=capacity_mw,
-                ebitda=ebitda,
-                fixed_assets=total_capex, # Gross fixed assets
-                interest_expense=interest if interest > 0 else 1e-6,
-                total_debt=current_debt,
-                cash_and_equivalents=ebitda * 0.1,
-                total_equity=total_equity,
-                total_assets=total_capex
-            )
-            
-            assessment = assess_credit_rating(metrics)
-            ratings_vals.append(assessment.overall_rating.numeric_score)
-        
+
+        # Amortize debt
+        # Simplified: assume linear paydown for leverage ratio calculation
+        # (This is an approximation for the plot)
+        current_debt = total_debt * (1 - np.arange(len(years)) / 30).clip(min=0)
+        interest = np.where(cf.interest_expense > 0, cf.interest_expense, 1e-6)
+
+        # Rate every year at once, then keep the plotted window
+        ratings_vals = assess_credit_rating_batch(
+            capacity_mw=capacity_mw,
+            ebitda=cf.ebitda,
+            fixed_assets=total_capex, # Gross fixed assets
+            interest_expense=interest,
+            total_debt=current_debt,
+            cash_and_equivalents=cf.ebitda * 0.1,
+            total_equity=total_equity,
+            total_assets=total_capex
+        )[mask]
+
         # Style
         linestyle = '-'
         if "Baseline" in name:
@@ -220,7 +218,7 @@ def plot_rating_migration(results, output_dir):
             linewidth = 1.5
             linestyle = '--'
             
-        ax.step(years_plot, ratings_vals, where='post', label=name, color=color, linewidth=linewidth, linestyle=linestyle)
+        ax.step(years_plot, ratings_vals, where='post', label=name, color=color, linewidth=linewidth, linestyle=linestyle, rasterized=True)
     
     # Investment Grade Line
     ax.axhline(4.5, color='black', linestyle=':', linewidth=1, label="Investment Grade Threshold")
@@ -237,9 +235,7 @@ def plot_rating_migration(results, output_dir):
     ax.legend(loc='lower left')
     ax.grid(True, linestyle='--', alpha=0.5)
     
-    plt.tight_layout()
-    plt.savefig(output_dir / "fig3_rating_migration.png", dpi=300, bbox_inches='tight')
-    plt.close()
+    FigureCanvasAgg(fig).print_png(output_dir / "fig3_rating_migration.png")
 
 def main():
     output_dir = Path("data/processed/figures")
@@ -3,9 +3,9 @@ Revenue Impact Analysis: 11th Basic Plan + Physical Risk
 """
 import sys
 from pathlib import Path
-import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -17,6 +17,32 @@ from src.risk.transition import apply_transition
 from src.financials.cashflow import compute_cashflows_timeseries
 from src.scenarios import TransitionScenario
 
+def _run_one(config, plant_params, transition_scenario):
+    """Lifetime revenue (billions) for one scenario config."""
+    # Get Physical Scenario
+    phys_scenario = get_physical_risk_scenario(config["physical"])
+    phys_adj = apply_physical(plant_params, phys_scenario)
+
+    # Get Transition Adjustments (Power Plan)
+    trans_adj = apply_transition(
+        plant_params,
+        transition_scenario,
+        korea_plan_scenario=config["plan"]
+    )
+
+    # Compute Cash Flows
+    cf = compute_cashflows_timeseries(
+        plant_params,
+        transition_scenario,
+        trans_adj,
+        phys_adj,
+        start_year=2024
+    )
+
+    # Total revenue (sum, no discounting) for the waterfall.
+    # Price is 120 USD/MWh, so dividing by 1e9 gives Billion USD.
+    return np.sum(cf.revenue) / 1e9
+
 def run_analysis():
     print("=" * 70)
     print("Revenue Impact Analysis: 11th Basic Plan & Physical Risk")
@@ -68,38 +94,11 @@ def run_analysis():
         carbon_price_2050=120
     )
 
-    results = {}
-
     # 2. Calculate Cash Flows
+    results = {}
     for name, config in scenarios.items():
         print(f"Analyzing: {name}...")
-        
-        # Get Physical Scenario
-        phys_scenario = get_physical_risk_scenario(config["physical"])
-        phys_adj = apply_physical(plant_params, phys_scenario)
-        
-        # Get Transition Adjustments (Power Plan)
-        trans_adj = apply_transition(
-            plant_params, 
-            dummy_transition, 
-            korea_plan_scenario=config["plan"]
-        )
-
-        # Compute Cash Flows
-        cf = compute_cashflows_timeseries(
-            plant_params,
-            dummy_transition,
-            trans_adj,
-            phys_adj,
-            start_year=2024
-        )
-        
-        # Store total revenue (NPV at 0% for simplicity, or just sum)
-        # Let's use Sum of Revenue for the waterfall
-        results[name] = np.sum(cf.revenue) / 1e9 # Billions KRW (assuming price is KRW/USD mixed, let's say USD for now, so Millions USD)
-        # Wait, price is 120. If USD, 1e9 is Billions.
-        # If KRW, 120 is too low. 120 USD/MWh is reasonable.
-        # So results are in Billion USD.
+        results[name] = _run_one(config, plant_params, dummy_transition)
 
     # 3. Visualize (Waterfall Chart)
     print("\nGenerating Waterfall Chart...")
@@ -121,7 +120,8 @@ def run_analysis():
     values = [baseline_rev, delta_policy, delta_phys_high, phys_high_rev]
     
     # Plot
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
     
     # Cumulative sum for waterfall
     # Step 1: Baseline (Bar)
@@ -179,7 +179,7 @@ def run_analysis():
     # Save
     output_path = project_root / "data/processed/revenue_waterfall.png"
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path)
+    FigureCanvasAgg(fig).print_png(output_path)
     print(f"Chart saved to: {output_path}")
     
     # Print Summary Table
@@ -4,21 +4,24 @@ Interactive dashboard for scenario comparison and visualization.
 """
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
 import sys
 
-import plotly.express as px
+import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 import pandas as pd
 import streamlit as st
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.pipeline.runner import CRPModelRunner
+from src.pipeline.runner import CRPModelRunner, RATING_DTYPE
 from src.reporting.plots import (
     plot_spreads, plot_cashflow_waterfall, plot_capacity_factor_trajectory,
-    plot_npv_comparison
+    plot_npv_comparison, downsample_minmax
 )
 try:
     from src.climada.hazards import load_climada_hazards, CLIMADAHazardData
@@ -41,6 +44,260 @@ COLORS = {
     "Highlight": "#3498db"
 }
 
+@st.cache_resource
+def register_chart_theme() -> str:
+    """
+    Register the app-wide Plotly template and make it the default.
+    Cached as a resource so the template is built once per server process,
+    not on every script rerun.
+    """
+    pio.templates["crp"] = go.layout.Template(layout=dict(colorway=list(dict.fromkeys(COLORS.values()))))
+    pio.templates.default = "plotly_white+crp"
+    return pio.templates.default
+
+register_chart_theme()
+
+# st.fragment (Streamlit >= 1.37) reruns only the decorated section when its own widgets change;
+# on older versions the section simply runs with the rest of the script
+_fragment = getattr(st, "fragment", lambda func: func)
+
+
+def lazy_tabs(labels: list[str]) -> list:
+    """
+    st.tabs that reruns on tab switch and reports which tab is open, so only the
+    selected tab's body has to run. Older Streamlit versions without tab state
+    fall back to plain tabs, which all render.
+    """
+    try:
+        return st.tabs(labels, key="main_tab", on_change="rerun")
+    except TypeError:
+        return st.tabs(labels)
+
+
+def tab_is_open(tab) -> bool:
+    """True unless Streamlit reports the tab as closed (``.open`` is None without tab state)."""
+    return getattr(tab, "open", None) is not False
+
+MAX_TABLE_ROWS = 200
+
+RATING_SCALE = ("AAA", "AA", "A", "BBB", "BB", "B")
+
+# Columns of scenario_comparison the dashboard reads; the rest stay on disk
+COMPARISON_COLS = (
+    "scenario", "npv_million", "irr_pct", "avg_dscr", "min_dscr", "llcr",
+    "overall_rating", "crp_bps", "debt_spread_bps",
+)
+
+@st.cache_data
+def _csv_bytes(df: pd.DataFrame) -> bytes:
+    """CSV encoding of a table, serialized once per table content rather than per rerun."""
+    return df.to_csv(index=False).encode()
+
+def show_table(df: pd.DataFrame, name: str, **kwargs) -> None:
+    """
+    st.dataframe limited to the first MAX_TABLE_ROWS rows, so long tables are not
+    serialized to the browser in full; the complete table is offered as a CSV download.
+    """
+    if len(df) <= MAX_TABLE_ROWS:
+        st.dataframe(df, use_container_width=True, **kwargs)
+        return
+    st.caption(f"{len(df)} rows, showing the first {MAX_TABLE_ROWS}")
+    st.dataframe(df.head(MAX_TABLE_ROWS), use_container_width=True, **kwargs)
+    st.download_button("Download full table (CSV)", _csv_bytes(df), file_name=f"{name}.csv", mime="text/csv", key=f"dl_{name}")
+
+@lru_cache(maxsize=32)
+def _load_raw_csv_cached(path: str, mtime: float, columns: tuple | None) -> pd.DataFrame:
+    """Parse a raw input CSV; mtime is part of the key so edits are picked up."""
+    return pd.read_csv(path, usecols=columns and list(columns))
+
+def load_raw_csv(csv_path: Path, columns: tuple | None = None) -> pd.DataFrame:
+    """
+    Read a raw input CSV once per file version instead of on every rerun (treat as read-only).
+    Pass columns to parse only those fields.
+    """
+    return _load_raw_csv_cached(str(csv_path), csv_path.stat().st_mtime, columns)
+
+@st.cache_resource
+def get_runner(base_dir: str, data_version: tuple) -> CRPModelRunner:
+    """
+    One model runner per raw-data version, shared across reruns and sessions.
+    The runner reads its six input tables once at construction; data_version
+    (raw CSV mtimes) rebuilds it when any of them is edited.
+    """
+    return CRPModelRunner(Path(base_dir))
+
+def raw_data_version(base_dir: Path) -> tuple:
+    """Names and mtimes of the raw input CSVs."""
+    return tuple(sorted((p.name, p.stat().st_mtime) for p in (base_dir / "data" / "raw").glob("*.csv")))
+
+@st.cache_resource
+def _read_table_cached(path: str, mtime: float, columns: tuple | None = None) -> pd.DataFrame:
+    """
+    Parse one exported table; cached per file version and column selection.
+    Held as a shared resource so reruns get the same frame back instead of an
+    unpickled copy (treat as read-only). Requested columns the file lacks
+    (e.g. financing fields) are skipped. Rating columns come back as ordered
+    categoricals from either format.
+    """
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq  # only reached when the exporter had pyarrow
+        present = pq.read_schema(path).names
+        df = pd.read_parquet(path, engine="pyarrow", columns=columns and [c for c in present if c in columns])
+    else:
+        df = pd.read_csv(path, usecols=columns and (lambda c: c in columns))
+        df = df.astype({c: RATING_DTYPE for c in df.columns if c.endswith("_rating")})
+    return _downcast_ints(df)
+
+def _downcast_ints(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink integer columns (years, notches, bps) to the smallest dtype that holds them.
+    Lossless, unlike narrowing floats, which would change displayed figures.
+    """
+    int_cols = df.select_dtypes("integer").columns
+    if len(int_cols):
+        df[int_cols] = df[int_cols].apply(pd.to_numeric, downcast="integer")
+    return df
+
+def load_table(csv_path: Path, columns: tuple | None = None) -> pd.DataFrame:
+    """
+    Read an exported table (shared, treat as read-only), preferring its Parquet
+    copy when that is at least as new as the CSV.
+    """
+    parquet_path = csv_path.with_suffix(".parquet")
+    if parquet_path.exists() and (not csv_path.exists() or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime):
+        csv_path = parquet_path
+    return _read_table_cached(str(csv_path), csv_path.stat().st_mtime, columns)
+
+@st.cache_resource
+def _load_cashflow_store(path: str, mtime: float, columns: tuple) -> dict[str, pd.DataFrame]:
+    """
+    Read the needed columns of the combined cashflow store once and split it by scenario.
+    The frames are shared across reruns and sessions (treat as read-only).
+    """
+    df = _downcast_ints(pd.read_parquet(path, engine="pyarrow", columns=["scenario", *columns]))
+    return {name: group.drop(columns="scenario").reset_index(drop=True)
+            for name, group in df.groupby("scenario", sort=False)}
+
+def load_cashflows(processed_dir: Path, scenarios, columns: tuple) -> Mapping:
+    """
+    Scenario -> cashflow frame for the given scenarios. Uses the combined
+    cashflows.parquet store when it is at least as new as every per-scenario
+    CSV, else reads the per-scenario exports lazily.
+    """
+    cf_paths = {name: processed_dir / f"cashflow_{name}.csv" for name in scenarios}
+    cf_paths = {name: p for name, p in cf_paths.items() if p.exists()}
+    store = processed_dir / "cashflows.parquet"
+    if store.exists():
+        store_mtime = store.stat().st_mtime
+        if all(p.stat().st_mtime <= store_mtime for p in cf_paths.values()):
+            by_scenario = _load_cashflow_store(str(store), store_mtime, columns)
+            return {name: by_scenario[name] for name in scenarios if name in by_scenario}
+    return LazyTables(cf_paths, columns)
+
+@st.cache_data
+def compute_comparison_summary(metrics_df: pd.DataFrame) -> dict | None:
+    """
+    Headline figures and NPV bridge for the Scenario Comparison tab.
+
+    Cached on the frame's content so widget reruns skip the row scans.
+    Returns None when there is no baseline or no risk scenario to compare.
+    """
+    # Scenario names are unique (one row per exported result), so index by them once
+    by_name = metrics_df.set_index("scenario", drop=False)
+    if "baseline" not in by_name.index or len(by_name) < 2:
+        return None
+    baseline = by_name.loc["baseline"]
+    risk_npv = by_name["npv_million"].drop("baseline")
+    worst_case = by_name.loc[risk_npv.idxmin()]
+
+    def first_matching(tag: str) -> pd.Series:
+        match = by_name.index[by_name.index.str.contains(tag)]
+        return by_name.loc[match[0]] if len(match) > 0 else baseline
+
+    base_npv = baseline["npv_million"]
+    # Transition and physical effects approximated from one scenario of each kind
+    trans_impact = first_matching("transition")["npv_million"] - base_npv
+    phys_impact = first_matching("physical")["npv_million"] - base_npv
+    combined_npv = first_matching("combined")["npv_million"]
+    # Interaction is the difference between combined and (baseline + trans + phys)
+    interaction = combined_npv - (base_npv + trans_impact + phys_impact)
+
+    return {
+        "base_rating": baseline.get("overall_rating", "AA-"),
+        "worst_rating": worst_case.get("overall_rating", "BBB+"),
+        "crp_bps": worst_case.get("crp_bps", 0),
+        "npv_loss": base_npv - worst_case["npv_million"],
+        "bridge_labels": ["Baseline", "Transition Impact", "Physical Impact", "Compound Interaction", "Final NPV"],
+        "bridge_deltas": [base_npv, trans_impact, phys_impact, interaction, combined_npv],
+    }
+
+# Key Metrics Table: source column -> (label, display format)
+KEY_METRICS_COLUMNS = {
+    "scenario": ("Scenario", None),
+    "npv_million": ("NPV (M$)", "%.1f"),
+    "irr_pct": ("IRR (%)", "%.2f"),
+    "avg_dscr": ("Avg DSCR", "%.2f"),
+    "min_dscr": ("Min DSCR", "%.2f"),
+    "llcr": ("LLCR", "%.2f"),
+}
+
+def key_metrics_config() -> dict:
+    """column_config for the Key Metrics Table; formatting happens in the browser, not on a copied frame."""
+    return {
+        col: st.column_config.NumberColumn(label, format=fmt) if fmt else st.column_config.TextColumn(label)
+        for col, (label, fmt) in KEY_METRICS_COLUMNS.items()
+    }
+
+@st.cache_data
+def comparison_views(metrics_df: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """Input-independent slices of the metrics table, derived once per table version."""
+    return {
+        "risk_scenarios": metrics_df[metrics_df["scenario"] != "baseline"].copy(),
+        # Labels and number formats are applied by st.dataframe's column_config
+        "key_metrics": metrics_df[list(KEY_METRICS_COLUMNS)],
+    }
+
+@st.cache_resource
+def rating_figure(credit_df: pd.DataFrame) -> go.Figure:
+    """Credit Rating by Scenario bar chart, built once per table version and shared across reruns."""
+    # One hashed lookup gives each rating's position on the scale; unknown ratings (-1) plot as B
+    codes = pd.Index(RATING_SCALE).get_indexer(credit_df["overall_rating"])
+    notches = np.where(codes < 0, len(RATING_SCALE), codes + 1)
+    # Investment grade is BBB (code 3) or better
+    colors = np.where((codes >= 0) & (codes <= 3), "#2ecc71", "#e74c3c")
+
+    fig = go.Figure(data=[go.Bar(
+        x=credit_df["scenario"],
+        y=notches,
+        text=credit_df["overall_rating"],
+        textposition="auto",
+        marker_color=colors
+    )])
+    fig.update_layout(
+        title="Credit Rating by Scenario",
+        yaxis=dict(tickvals=list(range(1, len(RATING_SCALE) + 1)), ticktext=list(RATING_SCALE), autorange="reversed")
+    )
+    return fig
+
+class LazyTables(Mapping):
+    """Name -> exported table mapping that reads a file only when its key is accessed."""
+
+    def __init__(self, paths: dict[str, Path], columns: tuple | None = None):
+        self._paths = paths
+        self._columns = columns
+
+    def __getitem__(self, key: str) -> pd.DataFrame:
+        return load_table(self._paths[key], self._columns)
+
+    def __contains__(self, key) -> bool:
+        return key in self._paths  # membership without reading the file
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
 def get_hazard_description(hazard: CLIMADAHazardData) -> str:
     """Generate a human-readable description of the hazard profile."""
     parts = []
@@ -71,79 +328,51 @@ st.set_page_config(
 )
 
 
+@lru_cache(maxsize=1)
+def logic_flow_dot() -> str:
+    """Graphviz source of the model logic diagram, read from assets once per process."""
+    return (Path(__file__).parent / "assets" / "logic_flow.dot").read_text()
+
 def render_logic_flow():
-    """Render the Mermaid diagram for model logic."""
+    """Render the Graphviz diagram for model logic."""
     st.markdown("### Model Architecture & Logic Flow")
     st.markdown("""
     This diagram illustrates how physical hazards and transition risks cascade through the financial model 
     to impact credit ratings and ultimately the Cost of Capital (WACC).
     """)
     
-    mermaid_code = """
-    graph TD
-        subgraph "External Risks"
-            A[Physical Hazards<br/>(CLIMADA)] -->|Wildfire, Flood, SLR| B(Physical Impact)
-            C[Transition Policy<br/>(11th Basic Plan)] -->|Carbon Tax, Phase-out| D(Transition Impact)
-        end
-
-        subgraph "Operational Impact"
-            B -->|Outages, Derating| E[Generation Volume<br/>(MWh)]
-            D -->|Utilization Cap| E
-            E --> F[Revenue]
-            D -->|Carbon Costs| G[O&M Costs]
-        end
-
-        subgraph "Financial Model"
-            F --> H{EBITDA}
-            G --> H
-            H --> I[Cash Flow Available<br/>for Debt Service]
-            I --> J[DSCR / LLCR]
-        end
-
-        subgraph "Valuation & Risk"
-            J -->|KIS Methodology| K[Credit Rating<br/>(AAA to B)]
-            K -->|Spread Matrix| L[Cost of Debt<br/>(Interest Rate)]
-            L --> M[WACC<br/>(Discount Rate)]
-            M --> N((NPV))
-            I --> N
-        end
-
-        style A fill:#f39c12,stroke:#333,stroke-width:2px
-        style C fill:#e74c3c,stroke:#333,stroke-width:2px
-        style K fill:#3498db,stroke:#333,stroke-width:2px
-        style N fill:#27ae60,stroke:#333,stroke-width:4px
-    """
-    st.graphviz_chart(mermaid_code)
+    st.graphviz_chart(logic_flow_dot())
 
 
-def render_hazard_explorer(base_dir: Path):
-    """Render the CLIMADA Hazard Explorer tab."""
+def render_hazard_explorer(df: pd.DataFrame | None):
+    """Render the CLIMADA Hazard Explorer tab from the hazard table loaded in main()."""
     st.header("🌍 CLIMADA Hazard Explorer")
     
-    climada_file = base_dir / "data" / "raw" / "climada_hazards.csv"
-    if not climada_file.exists():
+    if df is None:
         st.warning("CLIMADA hazard data not found.")
         return
-
-    df = pd.read_csv(climada_file)
     
     # Map visualization (Static placeholder for Samcheok)
     col1, col2 = st.columns([2, 1])
     
     with col1:
         st.subheader("Hazard Data by Scenario")
-        st.dataframe(df, use_container_width=True)
+        show_table(df, "climada_hazards")
         
         # Bar chart of outage rates
-        fig = px.bar(
-            df, 
-            x="scenario", 
-            y=["wildfire_outage_rate", "flood_outage_rate", "slr_capacity_derate"],
+        # One trace per hazard column, built directly instead of melting the frame through px
+        fig = go.Figure([
+            go.Bar(x=df["scenario"], y=df[col], name=col)
+            for col in ["wildfire_outage_rate", "flood_outage_rate", "slr_capacity_derate"]
+        ])
+        fig.update_layout(
             title="Physical Risk Components by Scenario",
-            labels={"value": "Annual Rate (0-1)", "variable": "Hazard Type"},
+            xaxis_title="scenario",
+            yaxis_title="Annual Rate (0-1)",
+            legend_title_text="Hazard Type",
             barmode="group"
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key="hazard_components")
 
     with col2:
         st.subheader("Site Context")
@@ -163,6 +392,41 @@ def render_hazard_explorer(base_dir: Path):
         """)
 
 
+@st.cache_resource
+def cashflow_figure(cf_df: pd.DataFrame, scenario: str) -> go.Figure:
+    """
+    Cash Flow Projection figure for one scenario table, built once and shared
+    across reruns (st.plotly_chart only reads it): free cash flow and EBITDA in
+    USD millions, each thinned with its own years.
+    """
+    # Scale both plotted series to USD millions in one block multiply
+    fcf_m, ebitda_m = (cf_df[["free_cash_flow", "ebitda"]].to_numpy() * 1e-6).T
+    years = cf_df["year"].to_numpy()
+    # Long series are thinned per trace, keeping each bucket's extremes
+    fcf_idx, ebitda_idx = downsample_minmax(fcf_m), downsample_minmax(ebitda_m)
+
+    fig_cf = go.Figure()
+    fig_cf.add_trace(go.Scattergl(x=years[fcf_idx], y=fcf_m[fcf_idx], name="Free Cash Flow", line=dict(color=COLORS["Positive"], width=3)))
+    fig_cf.add_trace(go.Bar(x=years[ebitda_idx], y=ebitda_m[ebitda_idx], name="EBITDA", marker_color=COLORS["Baseline"], opacity=0.3))
+    fig_cf.update_layout(title=f"Cash Flow: {scenario}", yaxis_title="USD Million")
+    return fig_cf
+
+@_fragment
+def render_cashflow_projection(cashflow_dfs: Mapping):
+    """
+    Render the Cash Flow Projection chart. Runs as a fragment where supported,
+    so picking another scenario reruns only this section, not the whole app.
+    """
+    st.subheader("Cash Flow Projection")
+    selected_scenario_cf = st.selectbox("Select Scenario", list(cashflow_dfs.keys()), key="cf_proj")
+    
+    if selected_scenario_cf in cashflow_dfs:
+        fig_cf = cashflow_figure(cashflow_dfs[selected_scenario_cf], selected_scenario_cf)
+        # A stable key keeps the same chart element across scenario changes, so the
+        # frontend updates it in place (Plotly.react) instead of remounting it
+        st.plotly_chart(fig_cf, use_container_width=True, key="cashflow_projection")
+
+
 def main():
     st.title("⚡ Climate Risk Premium – Samcheok Power Plant")
     st.markdown("""
@@ -190,8 +454,9 @@ def main():
     # Load CLIMADA scenarios
     climada_file = base_dir / "data" / "raw" / "climada_hazards.csv"
     climada_scenarios = []
-    if climada_file.exists():
-        df_climada = pd.read_csv(climada_file)
+    # Loaded once per rerun; the Hazard Explorer tab reuses this frame
+    df_climada = load_raw_csv(climada_file) if climada_file.exists() else None
+    if df_climada is not None:
         climada_scenarios = df_climada["scenario"].tolist()
         # Filter out baseline if present to avoid duplicates
         climada_scenarios = [s for s in climada_scenarios if s != "baseline"]
@@ -214,7 +479,7 @@ def main():
     if run_model:
         with st.spinner("Running multi-scenario analysis..."):
             try:
-                runner = CRPModelRunner(base_dir)
+                runner = get_runner(str(base_dir), raw_data_version(base_dir))
                 
                 # Define scenarios to run
                 # Start with standard set
@@ -255,10 +520,12 @@ def main():
         return
 
     # Load results
-    metrics_df = pd.read_csv(scenario_file)
+    metrics_df = load_table(scenario_file, COMPARISON_COLS)
+    views = comparison_views(metrics_df)
 
     # Main tabs
-    tab_logic, tab_profile, tab_hazards, tab_comparison, tab_financials, tab_crp, tab_ratings = st.tabs([
+    # Only the open tab's body runs; switching tabs reruns the script
+    tab_logic, tab_profile, tab_hazards, tab_comparison, tab_financials, tab_crp, tab_ratings = lazy_tabs([
         "🧠 Logic Flow",
         "🏭 Company Profile",
         "🌍 Hazard Explorer",
@@ -269,216 +536,150 @@ def main():
     ])
 
     with tab_logic:
-        render_logic_flow()
+        if tab_is_open(tab_logic):
+            render_logic_flow()
 
     with tab_profile:
-        st.header("🏭 Samcheok Blue Power (POSCO)")
+        if tab_is_open(tab_profile):
+            st.header("🏭 Samcheok Blue Power (POSCO)")
         
-        # Load plant params for dynamic display
-        plant_df = pd.read_csv(base_dir / "data" / "raw" / "plant_parameters.csv")
-        plant_params = dict(zip(plant_df['param_name'], plant_df['value']))
+            # Load plant params for dynamic display
+            plant_df = load_raw_csv(base_dir / "data" / "raw" / "plant_parameters.csv", columns=("param_name", "value"))
+            plant_params = dict(zip(plant_df['param_name'], plant_df['value']))
         
-        # Safe casting helper
-        def get_float_param(key, default=0.0):
-            try:
-                return float(plant_params.get(key, default))
-            except (ValueError, TypeError):
-                return default
-
-        capex_val = get_float_param('total_capex_million', 4900)
-        capex_trillion = capex_val / 1000 * 1.3 # Approx conversion to KRW
-        bond_yield = get_float_param('debt_interest_rate', 0.061) * 100
-        capacity = get_float_param('capacity_mw', 2100)
-        efficiency = get_float_param('efficiency', 0.42)
-        useful_life = int(get_float_param('useful_life', 30))
+            # Safe casting helper
+            def get_float_param(key, default=0.0):
+                try:
+                    return float(plant_params.get(key, default))
+                except (ValueError, TypeError):
+                    return default
+
+            capex_val = get_float_param('total_capex_million', 4900)
+            capex_trillion = capex_val / 1000 * 1.3 # Approx conversion to KRW
+            bond_yield = get_float_param('debt_interest_rate', 0.061) * 100
+            capacity = get_float_param('capacity_mw', 2100)
+            efficiency = get_float_param('efficiency', 0.42)
+            useful_life = int(get_float_param('useful_life', 30))
         
-        col1, col2 = st.columns([2, 1])
+            col1, col2 = st.columns([2, 1])
         
-        with col1:
-            st.markdown(f"""
-            ### Project Overview
-            **Samcheok Blue Power** is a {capacity:,.0f} MW ultra-supercritical coal-fired power plant in Samcheok, Gangwon Province. It is the **last coal plant** to be built in South Korea.
+            with col1:
+                st.markdown(f"""
+                ### Project Overview
+                **Samcheok Blue Power** is a {capacity:,.0f} MW ultra-supercritical coal-fired power plant in Samcheok, Gangwon Province. It is the **last coal plant** to be built in South Korea.
             
-            - **Owner:** Samcheok Blue Power Co., Ltd. (Subsidiary of POSCO)
-            - **Status:** Unit 1 (Commercial Operation May 2024), Unit 2 (Oct 2024)
-            - **Total Investment:** ~{capex_trillion:.1f} Trillion KRW (Model Input: ${capex_val:,.0f}M)
-            - **Financing:** Project Finance + Corporate Bonds
+                - **Owner:** Samcheok Blue Power Co., Ltd. (Subsidiary of POSCO)
+                - **Status:** Unit 1 (Commercial Operation May 2024), Unit 2 (Oct 2024)
+                - **Total Investment:** ~{capex_trillion:.1f} Trillion KRW (Model Input: ${capex_val:,.0f}M)
+                - **Financing:** Project Finance + Corporate Bonds
             
-            ### Financial Context
-            The project has faced significant financing challenges due to the global coal phase-out trend ("Coal Exit").
+                ### Financial Context
+                The project has faced significant financing challenges due to the global coal phase-out trend ("Coal Exit").
             
-            - **Credit Rating:** AA- (Negative Outlook) $\\to$ A+ (Downgraded due to ESG concerns)
-            - **Bond Yields:** Model uses **{bond_yield:.1f}%**, reflecting the "Coal Premium" over standard A+ rates.
-            - **Refinancing Risk:** Large volume of corporate bonds maturing in 2024-2026.
-            """)
+                - **Credit Rating:** AA- (Negative Outlook) $\\to$ A+ (Downgraded due to ESG concerns)
+                - **Bond Yields:** Model uses **{bond_yield:.1f}%**, reflecting the "Coal Premium" over standard A+ rates.
+                - **Refinancing Risk:** Large volume of corporate bonds maturing in 2024-2026.
+                """)
             
-        with col2:
-            st.info(f"""
-            **Key Specs**
-            - **Capacity:** {capacity:,.0f} MW
-            - **Efficiency:** {efficiency*100:.0f}% (USC)
-            - **Fuel:** Bituminous Coal
-            - **Life:** {useful_life} Years
-            """)
+            with col2:
+                st.info(f"""
+                **Key Specs**
+                - **Capacity:** {capacity:,.0f} MW
+                - **Efficiency:** {efficiency*100:.0f}% (USC)
+                - **Fuel:** Bituminous Coal
+                - **Life:** {useful_life} Years
+                """)
 
     with tab_hazards:
-        render_hazard_explorer(base_dir)
+        if tab_is_open(tab_hazards):
+            render_hazard_explorer(df_climada)
 
     with tab_comparison:
-        st.header("Scenario Comparison")
+        if tab_is_open(tab_comparison):
+            st.header("Scenario Comparison")
         
-        # Key Findings
-        st.subheader("🎯 Key Findings: The Three Key Outputs")
-        baseline_row = metrics_df[metrics_df["scenario"] == "baseline"]
-        if len(baseline_row) > 0:
-            baseline = baseline_row.iloc[0]
-            risk_scenarios = metrics_df[metrics_df["scenario"] != "baseline"]
-            
-            if len(risk_scenarios) > 0:
-                worst_idx = risk_scenarios["npv_million"].idxmin()
-                worst_case = risk_scenarios.loc[worst_idx]
-                
+            # Key Findings
+            st.subheader("🎯 Key Findings: The Three Key Outputs")
+            summary = compute_comparison_summary(metrics_df)
+            if summary:
                 k1, k2, k3 = st.columns(3)
-                
+
                 # 1. Credit Rating Signal
-                base_rating = baseline.get('overall_rating', 'AA-')
-                worst_rating = worst_case.get('overall_rating', 'BBB+')
-                k1.metric("1. Credit Rating Signal", f"{worst_rating}", f"Downgrade from {base_rating}", delta_color="inverse")
-                
-                # 2. Climate Risk Premium
-                crp = worst_case.get('crp_bps', 0)
-                k2.metric("2. Climate Risk Premium", f"+{crp:.0f} bps", "Cost of Debt Increase", delta_color="inverse")
-                
-                # 3. Valuation Impact
-                npv_loss = baseline['npv_million'] - worst_case['npv_million']
-                k3.metric("3. Valuation Impact (NPV)", f"-${npv_loss:,.0f}M", "Total Value Destroyed", delta_color="inverse")
+                k1.metric("1. Credit Rating Signal", f"{summary['worst_rating']}", f"Downgrade from {summary['base_rating']}", delta_color="inverse")
 
-        col1, col2 = st.columns(2)
+                # 2. Climate Risk Premium
+                k2.metric("2. Climate Risk Premium", f"+{summary['crp_bps']:.0f} bps", "Cost of Debt Increase", delta_color="inverse")
 
-        with col1:
-            st.subheader("NPV Waterfall")
-            # Create a simplified waterfall chart
-            if len(risk_scenarios) > 0:
-                # Calculate deltas from baseline
-                deltas = []
-                labels = []
-                
-                # Baseline
-                deltas.append(baseline['npv_million'])
-                labels.append("Baseline")
-                
-                # Transition Effect (approximate from a transition scenario)
-                trans_scen = metrics_df[metrics_df['scenario'].str.contains('transition')].iloc[0] if any(metrics_df['scenario'].str.contains('transition')) else baseline
-                trans_impact = trans_scen['npv_million'] - baseline['npv_million']
-                deltas.append(trans_impact)
-                labels.append("Transition Impact")
-                
-                # Physical Effect
-                phys_scen = metrics_df[metrics_df['scenario'].str.contains('physical')].iloc[0] if any(metrics_df['scenario'].str.contains('physical')) else baseline
-                phys_impact = phys_scen['npv_million'] - baseline['npv_million']
-                deltas.append(phys_impact)
-                labels.append("Physical Impact")
-                
-                # Combined (Residual interaction)
-                combined_scen = metrics_df[metrics_df['scenario'].str.contains('combined')].iloc[0] if any(metrics_df['scenario'].str.contains('combined')) else baseline
-                # Interaction is the difference between combined and (baseline + trans + phys)
-                interaction = combined_scen['npv_million'] - (baseline['npv_million'] + trans_impact + phys_impact)
-                deltas.append(interaction)
-                labels.append("Compound Interaction")
-                
-                # Final
-                deltas.append(combined_scen['npv_million'])
-                labels.append("Final NPV")
-                
-                fig = go.Figure(go.Waterfall(
-                    name = "20", orientation = "v",
-                    measure = ["absolute", "relative", "relative", "relative", "total"],
-                    x = labels,
-                    textposition = "outside",
-                    text = [f"${x:,.0f}M" for x in deltas],
-                    y = deltas,
-                    connector = {"line":{"color":"rgb(63, 63, 63)"}},
-                ))
-                fig.update_layout(title = "NPV Bridge: Baseline to Combined Risk", showlegend = False)
-                st.plotly_chart(fig, use_container_width=True)
-
-        with col2:
-            st.subheader("Key Metrics Table")
-            display_cols = ["scenario", "npv_million", "irr_pct", "avg_dscr", "min_dscr", "llcr"]
-            display_df = metrics_df[display_cols].copy()
-            display_df.columns = ["Scenario", "NPV (M$)", "IRR (%)", "Avg DSCR", "Min DSCR", "LLCR"]
-            st.dataframe(display_df, use_container_width=True, hide_index=True)
+                # 3. Valuation Impact
+                k3.metric("3. Valuation Impact (NPV)", f"-${summary['npv_loss']:,.0f}M", "Total Value Destroyed", delta_color="inverse")
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.subheader("NPV Waterfall")
+                # Create a simplified waterfall chart
+                if summary:
+                    labels = summary["bridge_labels"]
+                    deltas = summary["bridge_deltas"]
+
+                    fig = go.Figure(go.Waterfall(
+                        name = "20", orientation = "v",
+                        measure = ["absolute", "relative", "relative", "relative", "total"],
+                        x = labels,
+                        textposition = "outside",
+                        # Raw values in, formatted by Plotly's d3 number format rather than a Python loop
+                        text = deltas,
+                        texttemplate = "%{text:$,.0f}M",
+                        y = deltas,
+                        connector = {"line":{"color":"rgb(63, 63, 63)"}},
+                    ))
+                    fig.update_layout(title = "NPV Bridge: Baseline to Combined Risk", showlegend = False)
+                    st.plotly_chart(fig, use_container_width=True, key="npv_bridge")
+
+            with col2:
+                st.subheader("Key Metrics Table")
+                show_table(views["key_metrics"], "key_metrics", hide_index=True, column_config=key_metrics_config())
 
     with tab_financials:
-        st.header("Financial Metrics Deep Dive")
+        if tab_is_open(tab_financials):
+            st.header("Financial Metrics Deep Dive")
         
-        # Load cashflow data
-        cashflow_dfs = {}
-        for scenario_name in metrics_df["scenario"]:
-            cf_path = processed_dir / f"cashflow_{scenario_name}.csv"
-            if cf_path.exists():
-                cashflow_dfs[scenario_name] = pd.read_csv(cf_path)
-
-        if cashflow_dfs:
-            st.subheader("Cash Flow Projection")
-            selected_scenario_cf = st.selectbox("Select Scenario", list(cashflow_dfs.keys()), key="cf_proj")
-            
-            if selected_scenario_cf in cashflow_dfs:
-                cf_df = cashflow_dfs[selected_scenario_cf]
-                
-                fig_cf = go.Figure()
-                fig_cf.add_trace(go.Scatter(x=cf_df["year"], y=cf_df["free_cash_flow"] / 1e6, name="Free Cash Flow", line=dict(color=COLORS["Positive"], width=3)))
-                fig_cf.add_trace(go.Bar(x=cf_df["year"], y=cf_df["ebitda"] / 1e6, name="EBITDA", marker_color=COLORS["Baseline"], opacity=0.3))
-                
-                fig_cf.update_layout(title=f"Cash Flow: {selected_scenario_cf}", yaxis_title="USD Million", template="plotly_white")
-                st.plotly_chart(fig_cf, use_container_width=True)
+            # Load cashflow data
+            cashflow_dfs = load_cashflows(processed_dir, metrics_df["scenario"], ("year", "free_cash_flow", "ebitda"))
+
+            if cashflow_dfs:
+                render_cashflow_projection(cashflow_dfs)
 
     with tab_crp:
-        st.header("Climate Risk Premium Analysis")
-        risk_scenarios = metrics_df[metrics_df["scenario"] != "baseline"].copy()
+        if tab_is_open(tab_crp):
+            st.header("Climate Risk Premium Analysis")
+            risk_scenarios = views["risk_scenarios"]
         
-        if len(risk_scenarios) > 0:
-            st.subheader("Debt Spreads & Climate Risk Premium")
-            fig_crp = plot_spreads(risk_scenarios)
-            st.plotly_chart(fig_crp, use_container_width=True)
+            if len(risk_scenarios) > 0:
+                st.subheader("Debt Spreads & Climate Risk Premium")
+                fig_crp = plot_spreads(risk_scenarios)
+                st.plotly_chart(fig_crp, use_container_width=True, key="crp_spreads")
             
-            st.info("""
-            **Climate Risk Premium (CRP)** represents the additional yield investors demand to hold assets exposed to climate risks.
-            It is calculated as the difference between the risk-adjusted WACC and the baseline WACC.
-            """)
+                st.info("""
+                **Climate Risk Premium (CRP)** represents the additional yield investors demand to hold assets exposed to climate risks.
+                It is calculated as the difference between the risk-adjusted WACC and the baseline WACC.
+                """)
 
     with tab_ratings:
-        st.header("⭐ Credit Rating Migration")
-        credit_file = processed_dir / "credit_ratings.csv"
+        if tab_is_open(tab_ratings):
+            st.header("⭐ Credit Rating Migration")
+            credit_file = processed_dir / "credit_ratings.csv"
         
-        if credit_file.exists():
-            credit_df = pd.read_csv(credit_file)
-            
-            st.subheader("Rating Migration Matrix")
+            if credit_file.exists():
+                credit_df = load_table(credit_file)
             
-            # Create rating heatmap
-            rating_map = {"AAA": 1, "AA": 2, "A": 3, "BBB": 4, "BB": 5, "B": 6}
-            scenarios = credit_df["scenario"].tolist()
-            ratings = credit_df["overall_rating"].tolist()
+                st.subheader("Rating Migration Matrix")
             
-            colors = ["#2ecc71" if r in ["AAA", "AA", "A", "BBB"] else "#e74c3c" for r in ratings]
-
-            fig = go.Figure(data=[go.Bar(
-                x=scenarios,
-                y=[rating_map.get(r, 6) for r in ratings],
-                text=ratings,
-                textposition="auto",
-                marker_color=colors
-            )])
-
-            fig.update_layout(
-                title="Credit Rating by Scenario",
-                yaxis=dict(tickvals=[1, 2, 3, 4, 5, 6], ticktext=['AAA', 'AA', 'A', 'BBB', 'BB', 'B'], autorange="reversed")
-            )
-            st.plotly_chart(fig, use_container_width=True)
+                fig = rating_figure(credit_df)
+                st.plotly_chart(fig, use_container_width=True, key="rating_migration")
             
-            st.subheader("Detailed Ratings Table")
-            st.dataframe(credit_df, use_container_width=True)
+                st.subheader("Detailed Ratings Table")
+                show_table(credit_df, "credit_ratings")
 
     # Footer
     st.sidebar.markdown("---")
@@ -1,7 +1,15 @@
 """Financial modeling utilities."""
 
 from .cashflow import CashFlowResult, compute_cashflows, CashFlowTimeSeries, compute_cashflows_timeseries
-from .metrics import FinancialMetrics, calculate_metrics, DebtStructure, calculate_debt_service
+from .metrics import (
+    FinancialMetrics,
+    calculate_metrics,
+    DebtStructure,
+    calculate_debt_service,
+    stack_cashflows,
+    batch_npv,
+    batch_irr,
+)
 
 __all__ = [
     "CashFlowResult",
@@ -12,4 +20,7 @@ __all__ = [
     "calculate_metrics",
     "DebtStructure",
     "calculate_debt_service",
+    "stack_cashflows",
+    "batch_npv",
+    "batch_irr",
 ]
@@ -98,7 +98,7 @@ def compute_cashflows_timeseries(
     # Apply Market Demand factor to Base CF if market scenario exists
     if market_scenario:
         # Demand growth affects utilization
-        demand_factors = np.array([market_scenario.get_demand_factor(year, start_year) for year in years])
+        demand_factors = market_scenario.get_demand_factor(years, start_year)
         # Assume 1:1 relationship between demand growth and CF for simplicity, capped at 1.0
         base_cf_series = np.minimum(1.0, base_cf * demand_factors)
     else:
@@ -121,14 +121,14 @@ def compute_cashflows_timeseries(
     # Revenue
     # Apply Market Price if scenario exists
     if market_scenario:
-        prices = np.array([market_scenario.get_power_price(year, start_year) for year in years])
+        prices = market_scenario.get_power_price(years, start_year)
     else:
         prices = np.full(n_years, price)
         
     revenue = annual_mwh * prices
 
     # Carbon price trajectory
-    carbon_prices = np.array([transition_scenario.get_carbon_price(year) for year in years])
+    carbon_prices = transition_scenario.get_carbon_prices(years)
 
     # Costs
     fuel_costs = annual_mwh * heat_rate * fuel_price
@@ -4,7 +4,7 @@ Financial metrics: NPV, IRR, DSCR, LLCR for project finance analysis.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Sequence
 import numpy as np
 import numpy_financial as npf
 
@@ -114,7 +114,6 @@ def calculate_metrics(
     # DSCR (Debt Service Coverage Ratio) = EBITDA / Debt Service
     # Only calculate for years where debt is outstanding
     n_debt_years = min(debt_tenor, len(cashflows.ebitda))
-    dscr = np.zeros(n_debt_years)
     
     # Use Tax-Adjusted Cash Flow Available for Debt Service (CFADS)
     # CFADS = EBITDA - Tax (paid) - Capex + Working Capital Changes
@@ -125,15 +124,15 @@ def calculate_metrics(
     # So Net Income + Interest + Depreciation = EBITDA - Tax.
     # So CFADS = EBITDA - Tax.
     
-    # Calculate Tax from cashflows if available, else 0
-    tax_paid = getattr(cashflows, 'tax_expense', np.zeros(len(cashflows.ebitda)))
+    # Calculate Tax from cashflows if available, else 0 (a scalar broadcasts; no zeros array built up front)
+    tax_paid = getattr(cashflows, 'tax_expense', 0.0)
     cfads = cashflows.ebitda - tax_paid - cashflows.capex
     
-    for i in range(n_debt_years):
-        if debt_struct.annual_debt_service > 0:
-            dscr[i] = cfads[i] / debt_struct.annual_debt_service
-        else:
-            dscr[i] = np.inf
+    # One array division over the loan life; no debt service means unbounded coverage
+    if debt_struct.annual_debt_service > 0:
+        dscr = cfads[:n_debt_years] / debt_struct.annual_debt_service
+    else:
+        dscr = np.full(n_debt_years, np.inf)
 
     avg_dscr = np.mean(dscr) if len(dscr) > 0 else 0.0
     min_dscr = np.min(dscr) if len(dscr) > 0 else 0.0
@@ -160,3 +159,58 @@ def calculate_metrics(
         llcr=llcr,
         payback_years=payback_years,
     )
+
+
+def stack_cashflows(series: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Stack per-scenario cash-flow vectors into a (n_scenarios, n_years) array.
+    Shorter series are zero-padded, which leaves NPV and IRR unchanged.
+    """
+    n_years = max((len(s) for s in series), default=0)
+    values = np.zeros((len(series), n_years))
+    for i, s in enumerate(series):
+        values[i, :len(s)] = s
+    return values
+
+
+def batch_npv(values: np.ndarray, rate: float) -> np.ndarray:
+    """
+    NPV of every row of a 2-D cash-flow array in one broadcast reduction.
+    Discounts from period 0, matching npf.npv.
+    """
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    t = np.arange(values.shape[1])
+    return (values / (1 + rate) ** t).sum(axis=1)
+
+
+def batch_irr(
+    values: np.ndarray,
+    guess: float = 0.1,
+    tol: float = 1e-10,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """
+    IRR of every row of a 2-D cash-flow array.
+    Runs Newton iterations broadcast across all rows at once; rows that do not
+    converge (e.g. no sign change) return NaN, like npf.irr.
+    """
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    t = np.arange(values.shape[1])
+    rates = np.full(values.shape[0], guess)
+    converged = np.zeros(values.shape[0], dtype=bool)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(max_iter):
+            disc = (1 + rates[:, None]) ** -t
+            npv = (values * disc).sum(axis=1)
+            dnpv = -(t * values * disc).sum(axis=1) / (1 + rates)
+            step = npv / dnpv
+            # Halve the distance to -100% instead of stepping past it
+            new_rates = np.where(rates - step <= -1, (rates - 1) / 2, rates - step)
+            rates = np.where(converged, rates, new_rates)
+            converged |= np.abs(step) < tol
+            if converged.all():
+                break
+
+    rates[~converged | ~np.isfinite(rates) | (rates <= -1)] = np.nan
+    return rates
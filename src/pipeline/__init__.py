@@ -1,5 +1,5 @@
 """Pipeline orchestration for CSV-driven runs."""
 
-from .runner import CRPModelRunner, ScenarioResult
+from .runner import CRPModelRunner, ScenarioResult, model_source_version
 
-__all__ = ["CRPModelRunner", "ScenarioResult"]
+__all__ = ["CRPModelRunner", "ScenarioResult", "model_source_version"]
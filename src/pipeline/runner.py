@@ -4,6 +4,7 @@ Class-based orchestration for CRP runs using CSV inputs and CSV/plot outputs.
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict
+import hashlib
 from pathlib import Path
 from typing import Dict, Any, List
 
@@ -12,8 +13,8 @@ import pandas as pd
 from src.data import load_inputs, get_param_value
 from src.scenarios import TransitionScenario, PhysicalScenario, MarketScenario
 from src.risk import (
-    apply_transition, apply_physical, map_expected_loss_to_spreads, calculate_expected_loss, FinancingImpact,
-    assess_credit_rating, calculate_rating_metrics_from_financials, RatingAssessment,
+    apply_transition, apply_physical, PhysicalAdjustments, map_expected_loss_to_spreads, calculate_expected_loss, FinancingImpact,
+    assess_credit_rating, calculate_rating_metrics_from_financials, Rating, RatingAssessment,
     calculate_financing_from_rating
 )
 from src.financials import compute_cashflows_timeseries, calculate_metrics, CashFlowTimeSeries, FinancialMetrics
@@ -21,6 +22,44 @@ from src.scenarios.korea_power_plan import load_korea_power_plan_scenarios
 from src.risk.physical import get_physical_risk_scenario
 from src.climada.hazards import load_climada_hazards, CLIMADAHazardData
 
+# Parquet copies of the exports need pyarrow; CSV stays the canonical format
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# zstd decodes about as fast as snappy and gives smaller files
+PARQUET_COMPRESSION = "zstd"
+
+# Rating columns are exported as ordered categoricals, best (AAA) first
+RATING_DTYPE = pd.CategoricalDtype([r.name for r in Rating], ordered=True)
+
+
+def model_source_version(exclude: tuple[Path, ...] = ()) -> str:
+    """
+    SHA-1 of the model sources (src/**/*.py, minus exclude) for result-cache keys.
+    Hashing file contents catches uncommitted edits and works outside a git checkout.
+    """
+    skip = {Path(p).resolve() for p in exclude}
+    digest = hashlib.sha1()
+    for path in sorted(Path(__file__).resolve().parents[1].rglob("*.py")):
+        if path not in skip:
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _categorize_ratings(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast every *_rating column to RATING_DTYPE (Parquet keeps it as a dictionary column)."""
+    return df.astype({c: RATING_DTYPE for c in df.columns if c.endswith("_rating")})
+
+
+def _write_table(df: pd.DataFrame, csv_path: Path) -> None:
+    """Write df as CSV and, when pyarrow is available, as a sibling .parquet."""
+    df.to_csv(csv_path, index=False)
+    if PARQUET_AVAILABLE:
+        df.to_parquet(csv_path.with_suffix(".parquet"), engine="pyarrow", compression=PARQUET_COMPRESSION, index=False)
+
 
 @dataclass
 class ScenarioResult:
@@ -42,6 +81,9 @@ class CRPModelRunner:
         self.dataset = load_inputs(self.base_dir)
         self.power_plans = load_korea_power_plan_scenarios(self.base_dir / "data/raw/korea_power_plan.csv")
         self.climada_hazards = load_climada_hazards(self.base_dir / "data/raw/climada_hazards.csv")
+        # Memoized per-scenario sub-results shared across run_scenario calls
+        self._transition_cache: Dict[str, TransitionScenario] = {}
+        self._physical_adj_cache: Dict[str, PhysicalAdjustments] = {}
 
     def _get_plant_params(self) -> Dict[str, Any]:
         """Extract plant parameters as a flat dict."""
@@ -108,6 +150,32 @@ class CRPModelRunner:
             water_availability_pct=float(row.get('water_availability_pct', 100.0)),
         )
 
+    def _get_transition_scenario(self, scenario_name: str) -> TransitionScenario:
+        """Memoized _load_transition_scenario."""
+        if scenario_name not in self._transition_cache:
+            self._transition_cache[scenario_name] = self._load_transition_scenario(scenario_name)
+        return self._transition_cache[scenario_name]
+
+    def _get_physical_adjustments(
+        self, scenario_name: str, plant_params: Dict[str, Any]
+    ) -> PhysicalAdjustments:
+        """
+        Physical adjustments for a scenario, computed once per scenario name.
+        They do not depend on the transition or power plan, so multi-scenario
+        runs that share a physical scenario reuse the same derates.
+        """
+        if scenario_name not in self._physical_adj_cache:
+            physical_data = self._load_physical_scenario(scenario_name)
+            # Handle CLIMADA vs Standard Physical Scenario
+            if isinstance(physical_data, CLIMADAHazardData):
+                # Create a dummy base scenario for the signature, but pass climada_hazard
+                dummy_scenario = PhysicalScenario("CLIMADA", 0, 0, 0)
+                physical_adj = apply_physical(plant_params, dummy_scenario, climada_hazard=physical_data)
+            else:
+                physical_adj = apply_physical(plant_params, physical_data)
+            self._physical_adj_cache[scenario_name] = physical_adj
+        return self._physical_adj_cache[scenario_name]
+
     def _load_market_scenario(self, scenario_name: str) -> MarketScenario:
         """Load market scenario (demand/price)."""
         # For now, create default or simple variations since we don't have a CSV for this yet
@@ -130,8 +198,8 @@ class CRPModelRunner:
         """Run a single scenario."""
         plant_params = self._get_plant_params()
 
-        transition_scenario = self._load_transition_scenario(transition_scenario_name)
-        physical_data = self._load_physical_scenario(physical_scenario_name)
+        transition_scenario = self._get_transition_scenario(transition_scenario_name)
+        physical_adj = self._get_physical_adjustments(physical_scenario_name, plant_params)
         market_scenario = self._load_market_scenario(market_scenario_name)
 
         # Load Korea Power Plan if specified
@@ -144,14 +212,7 @@ class CRPModelRunner:
             transition_scenario,
             korea_plan_scenario=korea_plan
         )
-        
-        # Handle CLIMADA vs Standard Physical Scenario
-        if isinstance(physical_data, CLIMADAHazardData):
-            # Create a dummy base scenario for the signature, but pass climada_hazard
-            dummy_scenario = PhysicalScenario("CLIMADA", 0, 0, 0)
-            physical_adj = apply_physical(plant_params, dummy_scenario, climada_hazard=physical_data)
-        else:
-            physical_adj = apply_physical(plant_params, physical_data)
+
 
         cashflow = compute_cashflows_timeseries(
             plant_params,
@@ -283,18 +344,28 @@ class CRPModelRunner:
         results: Dict[str, ScenarioResult],
         output_dir: Path,
     ) -> Dict[str, Path]:
-        """Export scenario results to CSV files."""
+        """Export scenario results to CSV files (plus Parquet copies when pyarrow is installed)."""
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
         paths = {}
 
         # Export cashflow time series for each scenario
+        cf_frames = []
         for name, result in results.items():
             cf_df = pd.DataFrame(result.cashflow.to_dict())
             cf_path = output_dir / f"cashflow_{name}.csv"
-            cf_df.to_csv(cf_path, index=False)
+            _write_table(cf_df, cf_path)
             paths[f"cashflow_{name}"] = cf_path
+            cf_frames.append(cf_df.assign(scenario=name))
+
+        # All scenarios in one columnar store, so readers can load them in a single pass
+        if PARQUET_AVAILABLE and cf_frames:
+            store_path = output_dir / "cashflows.parquet"
+            pd.concat(cf_frames, ignore_index=True).to_parquet(
+                store_path, engine="pyarrow", compression=PARQUET_COMPRESSION, index=False
+            )
+            paths["cashflows"] = store_path
 
         # Export summary metrics
         metrics_rows = []
@@ -307,9 +378,9 @@ class CRPModelRunner:
                 row.update(result.credit_rating.to_dict())
             metrics_rows.append(row)
 
-        metrics_df = pd.DataFrame(metrics_rows)
+        metrics_df = _categorize_ratings(pd.DataFrame(metrics_rows))
         metrics_path = output_dir / "scenario_comparison.csv"
-        metrics_df.to_csv(metrics_path, index=False)
+        _write_table(metrics_df, metrics_path)
         paths["scenario_comparison"] = metrics_path
 
         # Export credit rating summary
@@ -321,9 +392,9 @@ class CRPModelRunner:
                 rating_rows.append(row)
 
         if rating_rows:
-            rating_df = pd.DataFrame(rating_rows)
+            rating_df = _categorize_ratings(pd.DataFrame(rating_rows))
             rating_path = output_dir / "credit_ratings.csv"
-            rating_df.to_csv(rating_path, index=False)
+            _write_table(rating_df, rating_path)
             paths["credit_ratings"] = rating_path
 
         return paths
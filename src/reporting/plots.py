@@ -4,11 +4,31 @@ Reporting and visualization helpers.
 from __future__ import annotations
 
 from typing import Dict
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 
+MAX_LINE_POINTS = 2000
+
+
+def downsample_minmax(y, n_out: int = MAX_LINE_POINTS) -> np.ndarray:
+    """
+    Sorted row indices that keep each bucket's min and max of y (plus both ends).
+    Returns every index when the series already fits in n_out points.
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    n_buckets = max((n_out - 2) // 2, 1)
+    size = -(-n // n_buckets)
+    # Pad with the last value so the series reshapes into equal buckets
+    buckets = np.pad(y, (0, n_buckets * size - n), mode="edge").reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size
+    picks = np.concatenate(([0, n - 1], offsets + buckets.argmin(axis=1), offsets + buckets.argmax(axis=1)))
+    return np.unique(np.minimum(picks, n - 1))
+
 
 def plot_spreads(spread_table: pd.DataFrame):
     """
@@ -43,6 +63,19 @@ def plot_spreads(spread_table: pd.DataFrame):
     return fig
 
 
+# Cashflow column -> waterfall label, in bar order; the last item is the total
+_WATERFALL_ITEMS = {
+    "revenue": "Revenue",
+    "fuel_costs": "Fuel Costs",
+    "variable_opex": "Variable O&M",
+    "fixed_opex": "Fixed O&M",
+    "carbon_costs": "Carbon Costs",
+    "outage_costs": "Outage Costs",
+    "ebitda": "EBITDA",
+}
+_WATERFALL_SIGNS = np.array([1, -1, -1, -1, -1, -1, 1], dtype=float)
+
+
 def plot_cashflow_waterfall(cashflow_df: pd.DataFrame, scenario_name: str = ""):
     """
     Waterfall chart showing revenue breakdown to EBITDA.
@@ -54,19 +87,15 @@ def plot_cashflow_waterfall(cashflow_df: pd.DataFrame, scenario_name: str = ""):
     else:
         return go.Figure()
 
-    revenue = row.get("revenue", 0) / 1e6
-    fuel = -row.get("fuel_costs", 0) / 1e6
-    var_opex = -row.get("variable_opex", 0) / 1e6
-    fixed = -row.get("fixed_opex", 0) / 1e6
-    carbon = -row.get("carbon_costs", 0) / 1e6
-    outage = -row.get("outage_costs", 0) / 1e6
-    ebitda = row.get("ebitda", 0) / 1e6
+    # One vector op over the line items: missing columns count as 0, costs are negated
+    values = row.reindex(list(_WATERFALL_ITEMS), fill_value=0).to_numpy(dtype=float)
+    values = values * _WATERFALL_SIGNS / 1e6
 
     fig = go.Figure(go.Waterfall(
         name="Cashflow", orientation="v",
-        measure=["relative", "relative", "relative", "relative", "relative", "relative", "total"],
-        x=["Revenue", "Fuel Costs", "Variable O&M", "Fixed O&M", "Carbon Costs", "Outage Costs", "EBITDA"],
-        y=[revenue, fuel, var_opex, fixed, carbon, outage, ebitda],
+        measure=["relative"] * (len(values) - 1) + ["total"],
+        x=list(_WATERFALL_ITEMS.values()),
+        y=values,
         connector={"line": {"color": "rgb(63, 63, 63)"}},
     ))
 
@@ -83,12 +112,15 @@ def plot_capacity_factor_trajectory(results_dict: Dict[str, pd.DataFrame]):
     """
     Line plot of capacity factor over time for multiple scenarios.
     results_dict: {scenario_name: cashflow_df}
+    Traces use WebGL (Scattergl) so draw cost stays flat as scenarios are added;
+    series longer than MAX_LINE_POINTS are thinned with downsample_minmax.
     """
     fig = go.Figure()
 
     for scenario_name, df in results_dict.items():
         if "year" in df.columns and "capacity_factor" in df.columns:
-            fig.add_trace(go.Scatter(
+            df = df.iloc[downsample_minmax(df["capacity_factor"])]
+            fig.add_trace(go.Scattergl(
                 x=df["year"],
                 y=df["capacity_factor"] * 100,
                 mode="lines+markers",
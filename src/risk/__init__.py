@@ -13,6 +13,7 @@ from .credit_rating import (
     RatingMetrics,
     RatingAssessment,
     assess_credit_rating,
+    assess_credit_rating_batch,
     calculate_rating_metrics_from_financials,
     rating_migration_analysis,
 )
@@ -30,6 +31,7 @@ __all__ = [
     "RatingMetrics",
     "RatingAssessment",
     "assess_credit_rating",
+    "assess_credit_rating_batch",
     "calculate_rating_metrics_from_financials",
     "rating_migration_analysis",
 ]
@@ -8,6 +8,10 @@ from dataclasses import dataclass
 from typing import Dict, Any, List
 from enum import Enum
 
+import numpy as np
+
+from .credit_rating_nb import classify_ratings_batch
+
 
 class Rating(Enum):
     """Credit rating categories."""
@@ -264,6 +268,47 @@ def calculate_rating_metrics_from_financials(
     )
 
 
+def _safe_ratio(num: np.ndarray, den: np.ndarray, default: float) -> np.ndarray:
+    """num / den where den > 0, default elsewhere."""
+    return np.divide(num, den, out=np.full(np.shape(num), default, dtype=float), where=den > 0)
+
+
+def assess_credit_rating_batch(
+    capacity_mw,
+    ebitda,
+    fixed_assets,
+    interest_expense,
+    total_debt,
+    cash_and_equivalents,
+    total_equity,
+    total_assets,
+) -> np.ndarray:
+    """
+    Vectorized assess_credit_rating over arrays of financial statement items.
+
+    Takes the same arguments as calculate_rating_metrics_from_financials (scalars
+    or broadcastable arrays) and returns the overall Rating values (1=AAA .. 6=B)
+    as an int8 array, one per element.
+    """
+    (capacity_mw, ebitda, fixed_assets, interest_expense, total_debt,
+     cash_and_equivalents, total_equity, total_assets) = np.broadcast_arrays(*(
+        np.asarray(x, dtype=float) for x in (
+            capacity_mw, ebitda, fixed_assets, interest_expense, total_debt,
+            cash_and_equivalents, total_equity, total_assets)
+    ))
+
+    metrics = np.stack([
+        capacity_mw,
+        _safe_ratio(ebitda * 100, fixed_assets, 0),
+        _safe_ratio(ebitda, interest_expense, 999),
+        _safe_ratio(total_debt - cash_and_equivalents, ebitda, 999),
+        _safe_ratio(total_debt * 100, total_equity, 999),
+        _safe_ratio(total_debt * 100, total_assets, 100),
+    ], axis=-1)
+
+    return classify_ratings_batch(metrics.reshape(-1, 6)).reshape(capacity_mw.shape)
+
+
 def rating_migration_analysis(
     baseline_rating: RatingAssessment,
     risk_rating: RatingAssessment,
@@ -0,0 +1,88 @@
+"""
+Compiled classification of KIS rating-grid metrics into overall ratings.
+
+Uses Numba when it is installed and falls back to an equivalent NumPy
+(broadcast threshold comparison) implementation otherwise.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Grid thresholds per metric (rows, in RatingMetrics field order) in ascending order.
+# Mirrors the rate_* ladders in credit_rating.py.
+RATING_THRESHOLDS = np.array([
+    [20, 100, 400, 800, 2000],   # capacity_mw
+    [1, 4, 8, 11, 15],           # ebitda_to_fixed_assets (%)
+    [1, 2, 4, 6, 12],            # ebitda_to_interest (x)
+    [1, 4, 7, 10, 12],           # net_debt_to_ebitda (x), lower is better
+    [80, 150, 250, 300, 400],    # debt_to_equity (%), lower is better
+    [20, 40, 60, 80, 90],        # debt_to_assets (%), lower is better
+], dtype=np.float64)
+HIGHER_IS_BETTER = np.array([True, True, True, False, False, False])
+
+
+def _classify_numpy(metrics: np.ndarray, thresholds: np.ndarray, higher_better: np.ndarray) -> np.ndarray:
+    """Broadcast version of the classifier, used without Numba."""
+    # Thresholds met per metric (np.digitize against every column at once), with the
+    # same >= / <= edges as the rate_* ladders
+    values = metrics[:, :, None]
+    count = np.where(higher_better[:, None], values >= thresholds, values > thresholds).sum(axis=-1)
+    components = np.where(higher_better, 6 - count, 1 + count)
+
+    # Worst component, upgraded one notch when 4+ components are better
+    worst = components.max(axis=1)
+    better_count = (components < worst[:, None]).sum(axis=1)
+    return np.where(better_count >= 4, np.maximum(1, worst - 1), worst).astype(np.int8)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _score_row(row, thresholds, higher_better):
+        """Overall rating value for one row of grid metrics."""
+        n_metrics = row.shape[0]
+        components = np.empty(n_metrics, np.int8)
+        worst = 1
+        for j in range(n_metrics):
+            count = 0
+            for k in range(thresholds.shape[1]):
+                if higher_better[j]:
+                    count += row[j] >= thresholds[j, k]
+                else:
+                    count += row[j] > thresholds[j, k]
+            rating = 6 - count if higher_better[j] else 1 + count
+            components[j] = rating
+            worst = max(worst, rating)
+
+        better_count = 0
+        for j in range(n_metrics):
+            better_count += components[j] < worst
+        if better_count >= 4 and worst > 1:
+            return worst - 1
+        return worst
+
+    @njit(parallel=True, cache=True)
+    def _classify_numba(metrics, thresholds, higher_better):
+        """Rows are independent, so they are scored in parallel."""
+        out = np.empty(metrics.shape[0], np.int8)
+        for i in prange(metrics.shape[0]):
+            out[i] = _score_row(metrics[i], thresholds, higher_better)
+        return out
+
+
+def classify_ratings_batch(metrics_2d: np.ndarray) -> np.ndarray:
+    """
+    Classify rows of grid metrics into overall Rating values (1=AAA .. 6=B).
+
+    metrics_2d is an (n, 6) float array whose columns follow the RatingMetrics
+    field order; returns an int8 array of length n.
+    """
+    metrics_2d = np.ascontiguousarray(metrics_2d, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _classify_numba(metrics_2d, RATING_THRESHOLDS, HIGHER_IS_BETTER)
+    return _classify_numpy(metrics_2d, RATING_THRESHOLDS, HIGHER_IS_BETTER)
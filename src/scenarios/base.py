@@ -6,6 +6,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
+
 
 @dataclass
 class TransitionScenario:
@@ -33,6 +35,14 @@ class TransitionScenario:
         else:
             return self.carbon_price_2050
 
+    def get_carbon_prices(self, years: np.ndarray) -> np.ndarray:
+        """Carbon price trajectory for an array of years (vectorized get_carbon_price)."""
+        return np.interp(
+            years,
+            [2025, 2030, 2040, 2050],
+            [self.carbon_price_2025, self.carbon_price_2030, self.carbon_price_2040, self.carbon_price_2050],
+        )
+
 
 @dataclass
 class PhysicalScenario:
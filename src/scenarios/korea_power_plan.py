@@ -4,7 +4,9 @@ Implements dispatch reduction trajectories from the 10th Basic Plan.
 """
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict
 import numpy as np
 
@@ -27,6 +29,11 @@ class KoreaPowerPlanScenario:
     policy_reference: str
     description: str = ""
 
+    @cached_property
+    def _years(self) -> list[int]:
+        """Trajectory years in ascending order, sorted once per scenario rather than per lookup."""
+        return sorted(self.cf_trajectory.keys())
+
     def get_capacity_factor(self, year: int, baseline_cf: float = 0.50) -> float:
         """
         Get capacity factor for a given year.
@@ -50,7 +57,7 @@ class KoreaPowerPlanScenario:
             return min(self.cf_trajectory[year], baseline_cf)
 
         # Find bounding years for interpolation
-        years = sorted(self.cf_trajectory.keys())
+        years = self._years
 
         # If before first year, use first year value
         if year < years[0]:
@@ -69,20 +76,16 @@ class KoreaPowerPlanScenario:
             else:
                 return min(self.cf_trajectory[years[-1]], baseline_cf)
 
-        # Linear interpolation between bounding years
-        for i in range(len(years) - 1):
-            if years[i] <= year <= years[i + 1]:
-                y0, y1 = years[i], years[i + 1]
-                cf0, cf1 = self.cf_trajectory[y0], self.cf_trajectory[y1]
-
-                # Linear interpolation
-                weight = (year - y0) / (y1 - y0)
-                cf = cf0 + weight * (cf1 - cf0)
+        # Linear interpolation between bounding years (binary search; year is strictly inside)
+        i = bisect_right(years, year)
+        y0, y1 = years[i - 1], years[i]
+        cf0, cf1 = self.cf_trajectory[y0], self.cf_trajectory[y1]
 
-                return min(cf, baseline_cf)
+        # Linear interpolation
+        weight = (year - y0) / (y1 - y0)
+        cf = cf0 + weight * (cf1 - cf0)
 
-        # Fallback (should not reach here)
-        return baseline_cf
+        return min(cf, baseline_cf)
 
     def get_operating_years(self, start_year: int = 2024, design_life: int = 40) -> int:
         """
@@ -126,8 +129,10 @@ def load_korea_power_plan_scenarios(file_path: str) -> Dict[str, KoreaPowerPlanS
     scenarios = {}
 
     # Scenario 1: Official 10th Power Plan (moderate)
-    official_years = df[df['scenario_type'].isin(['projection', 'ndc_target', 'plan_target'])]['year'].tolist()
-    official_cfs = df[df['scenario_type'].isin(['projection', 'ndc_target', 'plan_target'])]['implied_cf_samcheok'].tolist()
+    # Filter each scenario's rows once and pull both columns from the same slice
+    official_df = df.loc[df['scenario_type'].isin(['projection', 'ndc_target', 'plan_target']), ['year', 'implied_cf_samcheok']]
+    official_years = official_df['year'].tolist()
+    official_cfs = official_df['implied_cf_samcheok'].tolist()
 
     scenarios['official_10th_plan'] = KoreaPowerPlanScenario(
         name='official_10th_plan',
@@ -138,8 +143,9 @@ def load_korea_power_plan_scenarios(file_path: str) -> Dict[str, KoreaPowerPlanS
     )
 
     # Scenario 1.5: 11th Power Plan (Draft)
-    plan_11_years = df[df['scenario_type'] == 'official_11th_plan']['year'].tolist()
-    plan_11_cfs = df[df['scenario_type'] == 'official_11th_plan']['implied_cf_samcheok'].tolist()
+    plan_11_df = df.loc[df['scenario_type'] == 'official_11th_plan', ['year', 'implied_cf_samcheok']]
+    plan_11_years = plan_11_df['year'].tolist()
+    plan_11_cfs = plan_11_df['implied_cf_samcheok'].tolist()
     
     if plan_11_years:
         scenarios['official_11th_plan'] = KoreaPowerPlanScenario(
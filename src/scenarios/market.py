@@ -21,12 +21,12 @@ class MarketScenario:
     base_power_price: float = 80.0
 
     def get_demand_factor(self, year: int, base_year: int = 2025) -> float:
-        """Calculate demand multiplier relative to base year."""
+        """Calculate demand multiplier relative to base year (year may be an array)."""
         years_elapsed = year - base_year
         return (1 + self.demand_growth_pct / 100) ** years_elapsed
 
     def get_power_price(self, year: int, base_year: int = 2025) -> float:
-        """Calculate power price based on demand growth."""
+        """Calculate power price based on demand growth (year may be an array)."""
         demand_factor = self.get_demand_factor(year, base_year)
         demand_change_pct = (demand_factor - 1) * 100
         
@@ -4,7 +4,10 @@ Unit tests for financial logic.
 import pytest
 import numpy as np
 from src.financials.cashflow import compute_cashflows_timeseries, CashFlowTimeSeries
-from src.financials.metrics import calculate_metrics, calculate_debt_service
+from src.financials.metrics import (
+    calculate_metrics, calculate_debt_service, stack_cashflows, batch_npv, batch_irr
+)
+import numpy_financial as npf
 from src.risk import TransitionAdjustments, PhysicalAdjustments
 from src.scenarios import TransitionScenario
 
@@ -84,3 +87,22 @@ def test_metrics_integration(sample_plant_params, dummy_scenarios):
     # DSCR = 5.36
     
     assert metrics.avg_dscr > 5.0
+
+def test_batch_npv_irr_match_scalar():
+    rows = [
+        [-1000, 300, 400, 500],
+        [-1000, 100, 200, 300, 350],
+        [-500, 100, 100],
+    ]
+    values = stack_cashflows([np.array(r, dtype=float) for r in rows])
+    assert values.shape == (3, 5)
+
+    npvs = batch_npv(values, 0.08)
+    irrs = batch_irr(values)
+    for i, r in enumerate(rows):
+        assert np.isclose(npvs[i], npf.npv(0.08, r))
+        assert np.isclose(irrs[i], npf.irr(r))
+
+def test_batch_irr_no_sign_change():
+    irrs = batch_irr(np.array([[100.0, 100.0, 100.0]]))
+    assert np.isnan(irrs[0])
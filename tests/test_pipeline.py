@@ -0,0 +1,57 @@
+"""
+Unit tests for the scenario runner.
+"""
+import pytest
+import numpy as np
+from pathlib import Path
+from src.pipeline.runner import CRPModelRunner, model_source_version
+
+
+@pytest.fixture
+def runner():
+    return CRPModelRunner(Path(__file__).parent.parent)
+
+
+def test_physical_adjustments_memoized(runner):
+    """Scenarios sharing a physical scenario reuse one set of adjustments."""
+    a = runner.run_scenario("a", "baseline", "high_physical", power_plan_name="official_10th_plan")
+    b = runner.run_scenario("b", "baseline", "high_physical", power_plan_name="official_11th_plan")
+
+    assert list(runner._physical_adj_cache) == ["high_physical"]
+    assert not np.allclose(a.cashflow.capacity_factor[:10], b.cashflow.capacity_factor[:10])
+
+    fresh = CRPModelRunner(runner.base_dir).run_scenario("b", "baseline", "high_physical", power_plan_name="official_11th_plan")
+    assert np.isclose(fresh.metrics.npv, b.metrics.npv)
+
+
+def test_export_results_parquet_matches_csv(runner, tmp_path):
+    """Parquet copies of the exports hold the same data as the CSVs."""
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    results = {"baseline": runner.run_scenario("baseline", "baseline", "baseline")}
+    paths = runner.export_results(results, tmp_path)
+
+    csv_paths = [p for p in paths.values() if p.suffix == ".csv"]
+    for csv_path in csv_paths:
+        from_csv = pd.read_csv(csv_path)
+        from_parquet = pd.read_parquet(csv_path.with_suffix(".parquet"))
+        # Rating columns come back as ordered categoricals; compare their labels
+        rating_cols = [c for c in from_parquet.columns if c.endswith("_rating")]
+        for col in rating_cols:
+            assert from_parquet[col].cat.ordered
+        from_parquet = from_parquet.astype({c: object for c in rating_cols})
+        pd.testing.assert_frame_equal(from_csv, from_parquet, check_dtype=False)
+
+    # The combined store holds every scenario's cashflows, tagged by scenario
+    store = pd.read_parquet(paths["cashflows"], filters=[("scenario", "==", "baseline")])
+    pd.testing.assert_frame_equal(
+        store.drop(columns="scenario"), pd.read_csv(paths["cashflow_baseline"]), check_dtype=False
+    )
+
+
+def test_model_source_version_tracks_source_files():
+    """The cache key is stable across calls and changes when a source file drops out."""
+    runner_py = Path("src/pipeline/runner.py")
+    assert model_source_version() == model_source_version()
+    assert model_source_version(exclude=(runner_py,)) != model_source_version()
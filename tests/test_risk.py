@@ -142,3 +142,50 @@ def test_carbon_price_interpolation():
     # Test before/after range
     assert scenario.get_carbon_price(2020) == 0
     assert scenario.get_carbon_price(2060) == 150
+
+    # Vectorized trajectory agrees with the scalar ladder
+    import numpy as np
+    years = np.arange(2015, 2066)
+    assert np.allclose(scenario.get_carbon_prices(years), [scenario.get_carbon_price(y) for y in years])
+
+
+def test_assess_credit_rating_batch_matches_scalar():
+    """Vectorized rating matches assess_credit_rating element-wise, including grid edges."""
+    import numpy as np
+    from src.risk import assess_credit_rating, assess_credit_rating_batch, calculate_rating_metrics_from_financials
+
+    rng = np.random.default_rng(0)
+    n = 200
+    items = {
+        'capacity_mw': rng.choice([10, 20, 100, 400, 800, 2000, 2100], n).astype(float),
+        'ebitda': rng.uniform(-2e8, 8e8, n),
+        'fixed_assets': rng.choice([0, 4.9e9], n),
+        'interest_expense': rng.uniform(-1e7, 2e8, n),
+        'total_debt': rng.uniform(0, 3.5e9, n),
+        'cash_and_equivalents': rng.uniform(0, 1e8, n),
+        'total_equity': rng.choice([0, 1.47e9], n),
+        'total_assets': rng.choice([0, 4.9e9], n),
+    }
+    items['ebitda'][:3] = [0, 0.04 * 4.9e9, 0.15 * 4.9e9]  # threshold edges
+
+    batch = assess_credit_rating_batch(**items)
+    scalar = [
+        assess_credit_rating(calculate_rating_metrics_from_financials(
+            **{k: v[i] for k, v in items.items()})).overall_rating.value
+        for i in range(n)
+    ]
+    assert batch.tolist() == scalar
+
+
+def test_classify_ratings_batch_numba_matches_numpy():
+    """The Numba kernel and the NumPy fallback agree on every row."""
+    pytest.importorskip("numba")
+    import numpy as np
+    from src.risk import credit_rating_nb as nb
+
+    rng = np.random.default_rng(1)
+    metrics = rng.uniform(0, 2500, (500, 6))
+    metrics[:5] = nb.RATING_THRESHOLDS.T  # exact threshold edges
+
+    expected = nb._classify_numpy(metrics, nb.RATING_THRESHOLDS, nb.HIGHER_IS_BETTER)
+    np.testing.assert_array_equal(nb.classify_ratings_batch(metrics), expected)